@@ -0,0 +1,153 @@
+# cache.py
+import os
+import redis
+import redis.asyncio
+from redis.exceptions import RedisError
+from logger import get_structured_logger
+
+#Read-through cache for hot lookups (optional)
+#Enabled only when REDIS_URL is set - Example URL: redis://cache_host:6379/0
+#Any Redis failure falls back to the database; the cache never breaks a request
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "60"))
+
+cache_logger = get_structured_logger("cache")
+
+# Global Redis clients (created on first use) - sync for scripts, asyncio for the async routes
+redis_client = None
+async_redis_client = None
+
+def get_redis():
+    global redis_client
+    if REDIS_URL and redis_client is None:
+        redis_client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5)
+    return redis_client
+
+def cache_get(key: str):
+    """
+    Lê uma chave do cache; retorna None se ausente ou se o Redis estiver indisponível
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except RedisError as e:
+        cache_logger.warning("Falha ao ler do cache", key=key, error=str(e))
+        return None
+
+def cache_set(key: str, value, ttl: int = CACHE_TTL):
+    """
+    Grava uma chave no cache com TTL
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except RedisError as e:
+        cache_logger.warning("Falha ao gravar no cache", key=key, error=str(e))
+
+def cache_delete(*keys: str):
+    """
+    Remove chaves do cache (invalidação após escritas)
+    """
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except RedisError as e:
+        cache_logger.warning("Falha ao invalidar cache", keys=list(keys), error=str(e))
+
+def get_async_redis():
+    global async_redis_client
+    if REDIS_URL and async_redis_client is None:
+        async_redis_client = redis.asyncio.Redis.from_url(REDIS_URL, socket_timeout=0.5)
+    return async_redis_client
+
+async def async_cache_get(key: str):
+    """
+    Versão assíncrona de cache_get (não bloqueia o event loop)
+    """
+    client = get_async_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except RedisError as e:
+        cache_logger.warning("Falha ao ler do cache", key=key, error=str(e))
+        return None
+
+async def async_cache_set(key: str, value, ttl: int = CACHE_TTL):
+    """
+    Versão assíncrona de cache_set
+    """
+    client = get_async_redis()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl, value)
+    except RedisError as e:
+        cache_logger.warning("Falha ao gravar no cache", key=key, error=str(e))
+
+async def async_cache_delete(*keys: str):
+    """
+    Versão assíncrona de cache_delete
+    """
+    client = get_async_redis()
+    if client is None or not keys:
+        return
+    try:
+        await client.delete(*keys)
+    except RedisError as e:
+        cache_logger.warning("Falha ao invalidar cache", keys=list(keys), error=str(e))
+
+#Invalidation after writes: the keys are deleted right away and again once the transaction commits
+#(the second delete closes the window where a concurrent read re-caches the old row before the commit)
+#Pending keys and in-process caches live in Session.info until get_db/get_async_db commits
+PENDING_INVALIDATION = "pending_cache_invalidation"
+
+def _pending(info: dict, keys, local):
+    for local_cache in local:
+        local_cache.clear()
+    pending_keys, pending_local = info.setdefault(PENDING_INVALIDATION, (set(), set()))
+    pending_keys.update(keys)
+    pending_local.update(local)
+
+def invalidate(info: dict, keys=(), local=()):
+    """
+    Invalida chaves do Redis e caches do processo (objetos com clear()) agora e após o commit
+    info: Session.info da transação que fez a escrita
+    """
+    _pending(info, keys, local)
+    cache_delete(*keys)
+
+def invalidate_pending(info: dict):
+    """
+    Repete a invalidação agendada por invalidate (chamado após o commit)
+    """
+    pending = info.pop(PENDING_INVALIDATION, None)
+    if pending:
+        keys, local = pending
+        for local_cache in local:
+            local_cache.clear()
+        cache_delete(*keys)
+
+async def async_invalidate(info: dict, keys=(), local=()):
+    """
+    Versão assíncrona de invalidate
+    """
+    _pending(info, keys, local)
+    await async_cache_delete(*keys)
+
+async def async_invalidate_pending(info: dict):
+    """
+    Versão assíncrona de invalidate_pending
+    """
+    pending = info.pop(PENDING_INVALIDATION, None)
+    if pending:
+        keys, local = pending
+        for local_cache in local:
+            local_cache.clear()
+        await async_cache_delete(*keys)
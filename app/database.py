@@ -1,10 +1,14 @@
 # database.py
+import asyncio
 import os
 import time
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import OperationalError
 from models import Base
+from cache import async_invalidate_pending, invalidate_pending
 
 #Read from environment (Docker provides it) - No use for python-dotenv (only if local .env)
 #URL Structure: <Database>+<Connector>://{username}:{password}@{host}:{port}/{database_name}
@@ -14,9 +18,41 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("Environment variable DATABASE_URL is not set.")
 
+#Number of compiled statements kept by SQLAlchemy (see "[cached since ...]" in echo output)
+QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
+#Connection pool sizing (QueuePool) for the async engine the routes use - connections are
+#recycled before MariaDB's wait_timeout
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "40"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+#Seconds a request waits for a free connection before failing (bounded queueing under spikes)
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+#The sync engine only serves scripts and jobs (created on first use), so it keeps a small pool
+SYNC_POOL_SIZE = int(os.getenv("DB_SYNC_POOL_SIZE", "2"))
+SYNC_POOL_MAX_OVERFLOW = int(os.getenv("DB_SYNC_POOL_MAX_OVERFLOW", "2"))
+
+#Rows per multi-VALUES INSERT when SQLAlchemy batches an executemany (insertmanyvalues, default 1000)
+INSERTMANYVALUES_PAGE_SIZE = int(os.getenv("DB_INSERTMANYVALUES_PAGE_SIZE", "1000"))
+
+#Async driver used by the API routes (AsyncSession)
+#Derived from DATABASE_URL (pymysql -> aiomysql) unless ASYNC_DATABASE_URL is set
+#Example URL: mariadb+aiomysql://user:password@db_host:3306/database_name
+ASYNC_DRIVERS = {"pymysql": "aiomysql"}
+
+def _async_database_url() -> str:
+    url = os.getenv("ASYNC_DATABASE_URL")
+    if url:
+        return url
+    sync_url = make_url(DATABASE_URL)
+    driver = ASYNC_DRIVERS.get(sync_url.get_driver_name(), sync_url.get_driver_name())
+    return sync_url.set(drivername=f"{sync_url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
 # Global variables for engine and session
 engine = None
 SessionLocal = None
+async_engine = None
+AsyncSessionLocal = None
 
 def get_engine():
     global engine
@@ -29,7 +65,14 @@ def get_engine():
                 engine = create_engine(
                     DATABASE_URL,
                     pool_pre_ping=True,
+                    pool_size=SYNC_POOL_SIZE,
+                    max_overflow=SYNC_POOL_MAX_OVERFLOW,
+                    pool_recycle=POOL_RECYCLE,
+                    pool_timeout=POOL_TIMEOUT,
                     echo=True,
+                    #Cache de SQL compilado (padrão 500) - reaproveita a compilação das queries repetidas
+                    query_cache_size=QUERY_CACHE_SIZE,
+                    insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
                 )
                 connection = engine.connect()
                 connection.close()
@@ -45,23 +88,108 @@ def get_session_factory():
     global SessionLocal
     if SessionLocal is None:
         engine = get_engine()
+        #expire_on_commit=False evita um SELECT extra ao ler atributos após o commit
         SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=engine
         )
+        #Cache keys invalidated by the writes are deleted again once the transaction commits
+        event.listen(SessionLocal, "after_commit", lambda session: invalidate_pending(session.info))
     return SessionLocal
 
-#Initialize DB tables
-def init_db():
-    engine = get_engine()
-    Base.metadata.create_all(bind=engine)
+def get_async_engine():
+    global async_engine
+    if async_engine is None:
+        #init_db retries until the DB is ready before the first request uses this engine
+        async_engine = create_async_engine(
+            _async_database_url(),
+            pool_pre_ping=True,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            pool_recycle=POOL_RECYCLE,
+            pool_timeout=POOL_TIMEOUT,
+            echo=True,
+            query_cache_size=QUERY_CACHE_SIZE,
+            insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
+        )
+    return async_engine
+
+def get_async_session_factory():
+    global AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        AsyncSessionLocal = async_sessionmaker(
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_async_engine()
+        )
+    return AsyncSessionLocal
+
+#Initialize DB tables through the async engine (the sync one is only created if a script needs it)
+#Uses retry to try connecting to db (10 times with 3 seconds interval)
+#Prevents race condition on docker-compose and other paralelisms
+async def init_db():
+    engine = get_async_engine()
+    for _ in range(10):
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            return
+        except OperationalError:
+            print("Database not ready, retrying in 3 seconds...")
+            await asyncio.sleep(3)
+    raise RuntimeError("Database connection failed after retries.")
 
-#Dependency for FastAPI routes
+#Open every slot of the async pool (the one the routes use) at startup so the first requests
+#don't pay the connect cost
+#Connections are held together (not one by one) so the pool really grows to POOL_SIZE
+async def warmup_pool():
+    engine = get_async_engine()
+    connections = []
+    try:
+        for _ in range(POOL_SIZE):
+            connection = await engine.connect()
+            connections.append(connection)
+            await connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            await connection.close()
+
+#Sync unit of work (scripts, jobs, init) - one transaction per use
+#CRUD functions only flush; SessionLocal.begin() commits once when the request ends
+#(rolls back if the route raised) and closes the session
 def get_db():
     SessionLocal = get_session_factory()
-    db = SessionLocal()
-    try:
+    with SessionLocal.begin() as db:
         yield db
-    finally:
-        db.close()
+
+#Pool usage per engine for /metrics - checked_out close to size + max_overflow means saturation
+#The sync engine only shows up once a script or job has created it
+def pool_stats():
+    stats = {}
+    for name, current, max_overflow in (("sync", engine, SYNC_POOL_MAX_OVERFLOW),
+                                        ("async", async_engine, POOL_MAX_OVERFLOW)):
+        if current is None or not isinstance(current.pool, QueuePool):
+            continue
+        pool = current.pool
+        stats[name] = {
+            "size": pool.size(),
+            "max_overflow": max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    return stats
+
+#Dependency for FastAPI routes (AsyncSession) - same unit-of-work semantics as get_db
+#With the pinned FastAPI (0.116) the teardown runs inside the request handler, so the commit
+#(or rollback) finishes and the connection returns to the pool before the response is sent;
+#a failed commit becomes a 500 instead of a lost write. FastAPI 0.118+ moved the teardown after
+#the response - when upgrading, declare it as Depends(get_async_db, scope="function") (0.121+)
+#Cache keys invalidated by the writes are deleted again only after a successful commit
+async def get_async_db():
+    AsyncSessionLocal = get_async_session_factory()
+    async with AsyncSessionLocal.begin() as db:
+        yield db
+    await async_invalidate_pending(db.info)
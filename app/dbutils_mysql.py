@@ -1,1172 +1,1027 @@
-from sqlalchemy.orm import Session
+#Configuração de engine assumida por este módulo (ver database.py):
+#- query_cache_size (DB_QUERY_CACHE_SIZE): os statements pré-montados abaixo são compilados uma vez e reaproveitados
+#- insertmanyvalues_page_size (DB_INSERTMANYVALUES_PAGE_SIZE): executemany de INSERT vira INSERT multi-VALUES
+#  (use_insertmanyvalues já é o padrão no SQLAlchemy 2.x); os lotes de BULK_CHUNK_SIZE cabem em uma página
+#- pool_pre_ping e pool_recycle: conexões mortas pelo wait_timeout do MariaDB não chegam às funções daqui
+from sqlalchemy import bindparam, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from models import *
 from schemas import *
+from cache import cache_get, cache_set, invalidate
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import List, Tuple
 import hashlib
+import hmac
+import inspect
+import logging
 import os
+import threading
 import time
-from logger import get_structured_logger
+from logger import get_structured_logger, ns_to_ms
 
 PASS_SALT=os.getenv("PASS_SALT")
 if PASS_SALT is None:
     raise ValueError("Environment variable PASS_SALT is not set.")
+PASS_SALT_BYTES = PASS_SALT.encode('utf-8')
 
 db_logger = get_structured_logger("database")
 
+#Argon2id com o perfil recomendado pela OWASP (46 MiB, 2 iterações, 1 thread)
+#O salt é aleatório por usuário e fica embutido no próprio hash ($argon2id$...)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=46 * 1024, parallelism=1)
+
+#Cache opcional (PASS_HASH_CACHE=1) do resultado de verificações de senha por alguns segundos
+#Evita repetir o Argon2 em logins repetidos; a chave é um digest BLAKE2b, nunca a senha em texto puro
+PASS_HASH_CACHE = os.getenv("PASS_HASH_CACHE", "0") == "1"
+PASS_HASH_CACHE_SIZE = 4096
+PASS_HASH_CACHE_TTL = 30
+#verify_password roda em threads (asyncio.to_thread), então o OrderedDict só é lido/alterado com o lock
+_verify_cache = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+#Colunas expostas pelo UserReadDTO; leituras de usuário nunca trazem a senha
+USER_READ_COLUMNS = (User.id, User.username, User.email, User.phone_number)
+
+#Statements de leitura montados uma única vez no import (bindparam para os valores)
+_SEL_USER_BY_EMAIL = select(*USER_READ_COLUMNS).where(User.email == bindparam("email"))
+_SEL_USER_BY_USERNAME = select(*USER_READ_COLUMNS).where(User.username == bindparam("username"))
+_SEL_USER_BY_ID = select(*USER_READ_COLUMNS).where(User.id == bindparam("user_id"))
+#Checagem barata antes do hash da senha no registro: SELECT EXISTS(...), EXISTS(...) pelos índices únicos
+_SEL_USER_CONFLICT = select(
+    select(literal(1)).where(User.email == bindparam("email")).exists().label("email_taken"),
+    select(literal(1)).where(User.username == bindparam("username")).exists().label("username_taken"),
+)
+_SEL_USER_AUTH_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SEL_USER_FULL_BY_ID = (
+    select(User)
+    .options(
+        selectinload(User.teams).selectinload(Team.competitions),
+        selectinload(User.competitions),
+    )
+    .where(User.id == bindparam("user_id"))
+)
+_SEL_COMPETITION_BY_INVITE_CODE = select(
+    Competition.id,
+    Competition.name,
+    Competition.organizer,
+    Competition.invite_code,
+    Competition.start_date,
+    Competition.end_date
+).where(Competition.invite_code == bindparam("invite_code"))
+_SEL_TAG_BY_TYPE = select(Tag.id, Tag.type).where(Tag.type == bindparam("tag_type"))
+
+#Statements das tabelas de associação, também montados no import
+#O DELETE usa as colunas de chave estrangeira (o par da constraint única) como bindparams
+ASSOCIATION_MODELS = (UserCompetition, UserTeam, TeamCompetition, ExerciseTag, ExerciseCompetition, ContainerCompetition)
+_ASSOC_INSERT = {model: insert(model.__table__) for model in ASSOCIATION_MODELS}
+
+def _assoc_upsert(model) -> dict:
+    """
+    INSERT em lote que ignora só as violações da chave única, por dialeto
+    MySQL/MariaDB: ON DUPLICATE KEY UPDATE id = id (a linha existente não muda)
+    SQLite (testes): ON CONFLICT DO NOTHING
+    Ao contrário do INSERT IGNORE, FK inexistente, truncamento etc. continuam sendo erros
+    """
+    table = model.__table__
+    mysql_stmt = mysql_insert(table)
+    mysql_stmt = mysql_stmt.on_duplicate_key_update(id=table.c.id)
+    return {
+        "mysql": mysql_stmt,
+        "mariadb": mysql_stmt,
+        "sqlite": sqlite_insert(table).on_conflict_do_nothing(),
+    }
+
+_ASSOC_UPSERT = {model: _assoc_upsert(model) for model in ASSOCIATION_MODELS}
+#Quantas das linhas enviadas no lote foram gravadas (pelos IDs gerados; duplicatas mantêm o ID antigo)
+#O rowcount não serve: com CLIENT.FOUND_ROWS (sempre ligado pelo SQLAlchemy) a duplicata também conta 1
+_ASSOC_COUNT_BY_IDS = {
+    model: select(func.count()).select_from(model.__table__)
+    .where(model.__table__.c.id.in_(bindparam("ids", expanding=True)))
+    for model in ASSOCIATION_MODELS
+}
+_ASSOC_DELETE = {
+    model: delete(model.__table__).where(*[
+        column == bindparam(column.name)
+        for column in model.__table__.columns if column.foreign_keys
+    ])
+    for model in ASSOCIATION_MODELS
+}
+
+@contextmanager
+def bulk(db: Session):
+    """
+    Unidade de trabalho explícita para uso fora das rotas (scripts, jobs, testes)
+    As funções de escrita apenas fazem flush; aqui tudo é confirmado em um único
+    commit ao final ou desfeito em caso de erro. Nas rotas isso é feito por get_db
+    Uso: with bulk(db): create_exercise(db, ...); create_exercise_tag(db, ...)
+    """
+    if db.info.get("bulk_mode"):
+        yield db
+        return
+
+    db.info["bulk_mode"] = True
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.info.pop("bulk_mode", None)
+
+#Quantidade máxima de entradas em cada cache de consultas da sessão
+SESSION_CACHE_SIZE = 128
+
+def _session_cache(db: Session, name: str) -> OrderedDict:
+    """
+    Retorna o cache de consultas associado à sessão (vive apenas durante a requisição)
+    """
+    return db.info.setdefault(name, OrderedDict())
+
+def _session_cache_put(cache: OrderedDict, key, value):
+    """
+    Guarda um resultado no cache da sessão, descartando a entrada mais antiga se necessário
+    """
+    cache[key] = value
+    if len(cache) > SESSION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _session_cache_clear(db: Session, *names: str):
+    """
+    Invalida os caches de consultas da sessão após uma escrita
+    """
+    for name in names:
+        db.info.pop(name, None)
+
+def session_memoize(name: str):
+    """
+    Memoiza um getter (db, chave) no cache da sessão, evitando repetir a mesma
+    consulta dentro de uma requisição (resultados None também são guardados)
+    Escritas no mesmo modelo devem chamar _session_cache_clear(db, name)
+    Aceita getters síncronos (Session) e assíncronos (AsyncSession)
+    """
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(db, key):
+                cache = _session_cache(db, name)
+                if key in cache:
+                    return cache[key]
+                value = await fn(db, key)
+                _session_cache_put(cache, key, value)
+                return value
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(db: Session, key):
+            cache = _session_cache(db, name)
+            if key in cache:
+                return cache[key]
+            value = fn(db, key)
+            _session_cache_put(cache, key, value)
+            return value
+        return wrapper
+    return decorator
+
+class ProcessCache:
+    """
+    LRU com TTL em memória do processo, compartilhado entre requisições
+    Para tabelas pequenas e quase estáticas. A invalidação é local: cada worker tem
+    o seu e clear() só limpa o do processo que fez a escrita; nos demais a entrada
+    antiga vale até o TTL expirar, por isso ele é curto
+    """
+
+    def __init__(self, size: int, ttl: int):
+        self.size = size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        cached = self.entries.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+#Tags por tipo e competições por código de convite (só registros existentes)
+#Escritas nesses modelos limpam o cache inteiro deste worker (ver _invalidate_*_cache); os outros
+#workers podem servir o valor antigo por até PROCESS_CACHE_TTL segundos
+PROCESS_CACHE_TTL = int(os.getenv("PROCESS_CACHE_TTL", "10"))
+tag_type_cache = ProcessCache(1024, PROCESS_CACHE_TTL)
+invite_code_cache = ProcessCache(1024, PROCESS_CACHE_TTL)
+
+#Nomes dos caches de sessão por modelo (limpos juntos após escritas)
+USER_SESSION_CACHES = ("user_by_email", "user_by_username", "user_by_id")
+COMPETITION_SESSION_CACHES = ("competition_by_id", "competition_by_invite_code")
+
+def _to_dto(read_dto, source):
+    """
+    Monta o DTO de leitura com model_construct (sem validação) a partir de uma
+    instância ORM, Row ou dict vindos do nosso próprio schema
+    """
+    if isinstance(source, dict):
+        return read_dto.model_construct(**{name: source[name] for name in read_dto.model_fields})
+    return read_dto.model_construct(**{name: getattr(source, name) for name in read_dto.model_fields})
+
+#Violação de chave única no MySQL/MariaDB (ER_DUP_ENTRY); no SQLite (testes) o erro vem pelo nome
+ER_DUP_ENTRY = 1062
+SQLITE_DUPLICATE_ERRORS = ("SQLITE_CONSTRAINT_UNIQUE", "SQLITE_CONSTRAINT_PRIMARYKEY")
+
+def is_duplicate_key(error: IntegrityError) -> bool:
+    """
+    Indica se o IntegrityError é de chave duplicada (e não de FK, NOT NULL etc.)
+    """
+    orig = error.orig
+    if orig.args and orig.args[0] == ER_DUP_ENTRY:
+        return True
+    return getattr(orig, "sqlite_errorname", None) in SQLITE_DUPLICATE_ERRORS
+
+def _insert_returning(db: Session, model, values: dict, read_dto):
+    """
+    Executa o INSERT em um único round-trip e retorna o DTO de leitura
+    Usa RETURNING apenas das colunas do DTO quando o dialeto suporta (MariaDB 10.5+),
+    sem hidratar uma instância ORM; caso contrário monta o DTO com a chave
+    primária gerada e os valores já conhecidos
+    """
+    if db.get_bind().dialect.insert_returning:
+        columns = [getattr(model, name) for name in read_dto.model_fields]
+        row = db.execute(insert(model).values(**values).returning(*columns)).one()
+        return _to_dto(read_dto, row)
+    result = db.execute(insert(model).values(**values))
+    return _to_dto(read_dto, {"id": result.inserted_primary_key[0], **values})
+
+def _update_by_id(db: Session, model, entity_id: str, values: dict) -> bool:
+    """
+    UPDATE ... WHERE id = :id em um único round-trip, sem SELECT prévio
+    Retorna False quando nenhuma linha corresponde ao ID
+    """
+    result = db.execute(update(model).where(model.id == entity_id).values(**values))
+    return result.rowcount > 0
+
+#Linhas por INSERT em lote - mantém cada pacote abaixo do max_allowed_packet do MariaDB
+BULK_CHUNK_SIZE = 500
+#Itens aceitos por requisição nas rotas de criação em lote (acima disso a validação responde 422)
+BULK_MAX_ITEMS = 1000
+
+def _chunks(rows: list):
+    """
+    Divide uma lista de linhas em lotes de até BULK_CHUNK_SIZE
+    """
+    for start in range(0, len(rows), BULK_CHUNK_SIZE):
+        yield rows[start:start + BULK_CHUNK_SIZE]
+
+def _insert_ignore_duplicates(db: Session, model, rows: List[dict]) -> int:
+    """
+    INSERT em lote em uma tabela de associação em que só as linhas que violam a chave única são
+    descartadas pelo banco (ver _assoc_upsert); outros erros de integridade abortam o lote
+    Retorna a quantidade de linhas efetivamente inseridas
+    """
+    if not rows:
+        return 0
+    rows = [{"id": new_uuid(), **row} for row in rows]
+    stmt = _ASSOC_UPSERT[model][db.get_bind().dialect.name]
+    for chunk in _chunks(rows):
+        db.execute(stmt, chunk)
+    return db.execute(_ASSOC_COUNT_BY_IDS[model], {"ids": [row["id"] for row in rows]}).scalar()
+
+def db_op(operation: str, table: str, label: str, fields, describe):
+    """
+    Decorator com o padrão de timing/log das criações de entidades:
+    log de início, log_database no sucesso e log de erro com a duração antes de relançar
+    fields(dto): campos dos logs de início e de erro
+    describe(resultado): campos do log de sucesso
+    Resultado None (registro violaria uma chave única) gera apenas um aviso
+    Aceita funções síncronas (Session) e assíncronas (AsyncSession)
+    """
+    def start(dto):
+        log_fields = fields(dto)
+        db_logger.info("Iniciando criação de %s no banco de dados", label, **log_fields)
+        return log_fields, time.perf_counter_ns()
+
+    def success(result, log_fields: dict, start_ns: int):
+        if result is None:
+            db_logger.warning("Criação de %s ignorada: registro já existe", label, **log_fields)
+            return
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database(operation, table, duration_ns, **describe(result))
+
+    def failure(e: Exception, log_fields: dict, start_ns: int):
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao criar %s no banco de dados", label, 
+                       error=str(e),
+                       duration_ms=ns_to_ms(duration_ns),
+                       **log_fields)
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(db, dto):
+                log_fields, start_ns = start(dto)
+                try:
+                    result = await fn(db, dto)
+                    success(result, log_fields, start_ns)
+                    return result
+                except Exception as e:
+                    failure(e, log_fields, start_ns)
+                    raise e
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(db: Session, dto):
+            log_fields, start_ns = start(dto)
+            try:
+                result = fn(db, dto)
+                success(result, log_fields, start_ns)
+                return result
+            except Exception as e:
+                failure(e, log_fields, start_ns)
+                raise e
+        return wrapper
+    return decorator
+
+class Crud:
+    """
+    Operações por ID (leitura, atualização e deleção) de uma entidade
+    As funções get_*_by_id / update_* / delete_* de cada entidade delegam para uma instância
+    describe: monta os campos extras do log de deleção a partir do objeto removido
+    on_change: chamado após atualizar/deletar (invalidação de caches)
+    Update e delete invalidam a chave <tabela>:<id> do read-through por ID (ver AsyncCrud.get_by_id)
+    """
+
+    def __init__(self, model, read_dto, label: str, id_field: str, describe, on_change=None):
+        self.model = model
+        self.read_dto = read_dto
+        self.label = label
+        self.id_field = id_field
+        self.describe = describe
+        self.on_change = on_change
+        #Colunas do DTO por ID, relidas após o UPDATE (montado uma única vez)
+        self.select_by_id = (
+            select(*[getattr(model, name) for name in read_dto.model_fields])
+            .where(model.id == bindparam("entity_id"))
+        )
+
+    def cache_key(self, entity_id: str) -> str:
+        return f"{self.model.__tablename__}:{entity_id}"
+
+    def get_by_id(self, db: Session, entity_id: str):
+        """
+        Busca pelo ID (Session.get responde pelo identity map sem SQL quando possível)
+        """
+        entity = db.get(self.model, entity_id)
+        if entity:
+            return _to_dto(self.read_dto, entity)
+        return None
+
+    def update(self, db: Session, entity_id: str, values: dict):
+        """
+        Atualiza pelo ID: UPDATE (rowcount 0 = ID inexistente, retorna None) e um SELECT
+        O DTO vem da linha relida após o UPDATE (MariaDB não tem UPDATE ... RETURNING), com os
+        valores como o banco os guardou (ex.: datas sem fuso) - o mesmo que um GET devolve
+        """
+        if not _update_by_id(db, self.model, entity_id, values):
+            return None
+        db.flush()
+        invalidate(db.info, [self.cache_key(entity_id)])
+        if self.on_change:
+            self.on_change(db, entity_id)
+        
+        row = db.execute(self.select_by_id, {"entity_id": entity_id}).one()
+        return _to_dto(self.read_dto, row)
+
+    def delete(self, db: Session, entity_id: str) -> bool:
+        """
+        Deleta pelo ID; retorna False se o ID não existir
+        """
+        ids = {self.id_field: entity_id}
+        start_ns = time.perf_counter_ns()
+        db_logger.info("Iniciando deleção de %s no banco de dados", self.label, **ids)
+        
+        try:
+            entity = db.get(self.model, entity_id)
+            if not entity:
+                db_logger.warning("Tentativa de deletar %s inexistente", self.label, **ids)
+                return False
+            
+            db.delete(entity)
+            db.flush()
+            invalidate(db.info, [self.cache_key(entity_id)])
+            if self.on_change:
+                self.on_change(db, entity_id)
+            
+            duration_ns = time.perf_counter_ns() - start_ns
+            db_logger.log_database("DELETE", self.model.__tablename__, duration_ns, 
+                                  **ids,
+                                  **self.describe(entity))
+            
+            return True
+        
+        except Exception as e:
+            duration_ns = time.perf_counter_ns() - start_ns
+            db_logger.error("Erro ao deletar %s no banco de dados", self.label, 
+                           error=str(e),
+                           duration_ms=ns_to_ms(duration_ns),
+                           **ids)
+            raise e
+
+@session_memoize("user_by_email")
 def get_user_by_email(db: Session, email: str) -> UserReadDTO:
     """
     Busca um usuário pelo email
     """
-    user = db.query(User).filter(User.email == email).first()
-    if user:
-        return UserReadDTO(id=user.id, username=user.username, email=user.email, phone_number=user.phone_number)
+    row = db.execute(_SEL_USER_BY_EMAIL, {"email": email}).first()
+    if row:
+        return UserReadDTO.model_construct(**row._mapping)
     return None
 
+@session_memoize("user_by_username")
 def get_user_by_username(db: Session, username: str) -> UserReadDTO:
     """
     Busca um usuário pelo username
     """
-    user = db.query(User).filter(User.username == username).first()
-    if user:
-        return UserReadDTO(id=user.id, username=user.username, email=user.email, phone_number=user.phone_number)
+    row = db.execute(_SEL_USER_BY_USERNAME, {"username": username}).first()
+    if row:
+        return UserReadDTO.model_construct(**row._mapping)
     return None
 
+@session_memoize("user_by_id")
 def get_user_by_id(db: Session, user_id: str) -> UserReadDTO:
     """
     Busca um usuário pelo ID
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    row = db.execute(_SEL_USER_BY_ID, {"user_id": user_id}).first()
+    if row:
+        return UserReadDTO.model_construct(**row._mapping)
+    return None
+
+def get_user_by_id_full(db: Session, user_id: str) -> UserReadFullDTO:
+    """
+    Busca um usuário pelo ID com times (e suas competições) e competições
+    Usa selectinload para carregar o grafo em poucas queries, sem N+1
+    """
+    user = db.scalars(_SEL_USER_FULL_BY_ID, {"user_id": user_id}).first()
     if user:
-        return UserReadDTO(id=user.id, username=user.username, email=user.email, phone_number=user.phone_number)
+        return UserReadFullDTO.model_validate(user)
     return None
 
 def pass_hasher(password : str) -> str:
     """
-    Gera hash da senha usando SHA-256 com salt
+    Gera hash da senha usando Argon2id com salt aleatório
     """
-    hasher = hashlib.sha256()
-    hasher.update((password + PASS_SALT).encode('utf-8'))
-    return hasher.hexdigest()
+    return password_hasher.hash(password)
 
-def create_user(db: Session, userDTO: UserCreateDTO) -> UserReadDTO:
+def legacy_pass_digest(password : str) -> bytes:
     """
-    Cria um novo usuário no banco de dados
+    Digest legado (SHA-256 com salt global, 32 bytes), usado apenas para validar senhas antigas
+    No banco ele está em hex; a comparação é feita sobre os bytes crus
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de usuário no banco de dados", 
-                   email=userDTO.email, 
-                   username=userDTO.username)
-    
+    #hashlib.sha256 já é o EVP do OpenSSL (usa SHA-NI/ARMv8 quando a CPU suporta)
+    #Dois update() no mesmo contexto evitam alocar o buffer concatenado (mesmo digest)
+    hasher = hashlib.sha256(password.encode('utf-8'))
+    hasher.update(PASS_SALT_BYTES)
+    return hasher.digest()
+
+def verify_password(stored : str, candidate : str) -> Tuple[bool, bool]:
+    """
+    Verifica a senha informada contra o hash armazenado
+    Output: (senha válida, hash precisa ser regerado)
+    Hashes que não começam com $argon2 são do formato SHA-256 legado e
+    sempre precisam ser regerados após uma verificação bem-sucedida
+    """
+    if not PASS_HASH_CACHE:
+        return _verify_password(stored, candidate)
+
+    key = hashlib.blake2b(f"{stored}\0{candidate}".encode('utf-8'), digest_size=16).digest()
+    with _verify_cache_lock:
+        cached = _verify_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    #O hash (Argon2) roda fora do lock para não serializar logins concorrentes
+    result = _verify_password(stored, candidate)
+    with _verify_cache_lock:
+        _verify_cache[key] = (time.monotonic() + PASS_HASH_CACHE_TTL, result)
+        _verify_cache.move_to_end(key)
+        if len(_verify_cache) > PASS_HASH_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return result
+
+def _verify_password(stored : str, candidate : str) -> Tuple[bool, bool]:
+    """
+    Verificação sem cache (Argon2id ou SHA-256 legado)
+    """
+    if not stored.startswith("$argon2"):
+        try:
+            stored_digest = bytes.fromhex(stored)
+        except ValueError:
+            return False, False
+        valid = hmac.compare_digest(stored_digest, legacy_pass_digest(candidate))
+        return valid, valid
     try:
-        hashed_password = pass_hasher(userDTO.password)
-        db_logger.debug("Senha hashada com sucesso", email=userDTO.email)
-        user = User(
-            username=userDTO.username,
-            email=userDTO.email,
-            password=hashed_password,
-            phone_number=userDTO.phone_number
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        password_hasher.verify(stored, candidate)
+    except (VerificationError, InvalidHashError):
+        return False, False
+    return True, password_hasher.check_needs_rehash(stored)
+
+def authenticate_user(db: Session, email: str, password: str) -> UserReadDTO:
+    """
+    Autentica um usuário pelo email, migrando hashes legados para Argon2id
+    """
+    user = db.scalars(_SEL_USER_AUTH_BY_EMAIL, {"email": email}).first()
+    if not user:
+        return None
 
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "users", duration, 
-                              user_id=user.id,
-                              email=user.email,
-                              username=user.username)
+    valid, needs_rehash = verify_password(user.password, password)
+    if not valid:
+        db_logger.warning("Falha de autenticação", email=email)
+        return None
 
-        return UserReadDTO(id=user.id, username=user.username, email=user.email, phone_number=user.phone_number)
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar usuário no banco de dados", 
-                       error=str(e),
-                       email=userDTO.email,
-                       username=userDTO.username,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    if needs_rehash:
+        user.password = pass_hasher(password)
+        db.flush()
+        db_logger.info("Hash de senha atualizado para Argon2id", user_id=user.id)
+
+    return _to_dto(UserReadDTO, user)
 
-def get_competition_by_id(db: Session, competition_id: str) -> CompetitionReadDTO:
+@db_op("CREATE", "users", "usuário",
+       fields=lambda dto: {"email": dto.email, "username": dto.username},
+       describe=lambda user: {"user_id": user.id, "email": user.email, "username": user.username})
+def create_user(db: Session, userDTO: UserCreateDTO) -> UserReadDTO:
     """
-    Busca uma competição pelo ID
+    Cria um novo usuário no banco de dados
     """
-    competition = db.query(Competition).filter(Competition.id == competition_id).first()
-    if competition:
-        return CompetitionReadDTO(
-            id=competition.id,
-            name=competition.name,
-            organizer=competition.organizer,
-            invite_code=competition.invite_code,
-            start_date=competition.start_date.isoformat(),
-            end_date=competition.end_date.isoformat()
-        )
-    return None
+    hashed_password = pass_hasher(userDTO.password)
+    if db_logger.isEnabledFor(logging.DEBUG):
+        db_logger.debug("Senha hashada com sucesso", email=userDTO.email)
+    user = _insert_returning(db, User, {
+        "username": userDTO.username,
+        "email": userDTO.email,
+        "password": hashed_password,
+        "phone_number": userDTO.phone_number
+    }, UserReadDTO)
+    db.flush()
+    _session_cache_clear(db, *USER_SESSION_CACHES)
+    return user
 
+@session_memoize("competition_by_invite_code")
 def get_competition_by_invite_code(db: Session, invite_code: str) -> CompetitionReadDTO:
     """
     Busca uma competição pelo código de convite
     """
-    competition = db.query(Competition).filter(Competition.invite_code == invite_code).first()
+    competition = invite_code_cache.get(invite_code)
     if competition:
-        return CompetitionReadDTO(
-            id=competition.id,
-            name=competition.name,
-            organizer=competition.organizer,
-            invite_code=competition.invite_code,
-            start_date=competition.start_date.isoformat(),
-            end_date=competition.end_date.isoformat()
-        )
+        return competition
+
+    #Read-through no Redis (quando habilitado); ic_id:<id> guarda o código para invalidação
+    key = f"ic:{invite_code}"
+    cached = cache_get(key)
+    if cached:
+        competition = CompetitionReadDTO.model_validate_json(cached)
+        invite_code_cache.put(invite_code, competition)
+        return competition
+
+    row = db.execute(_SEL_COMPETITION_BY_INVITE_CODE, {"invite_code": invite_code}).first()
+    if row:
+        competition = _to_dto(CompetitionReadDTO, row)
+        cache_set(key, competition.model_dump_json())
+        cache_set(f"ic_id:{competition.id}", invite_code)
+        invite_code_cache.put(invite_code, competition)
+        return competition
     return None
 
+def _competition_cache_keys(competition_id: str, invite_code) -> list:
+    """
+    Chaves do Redis da competição pelo código de convite (invite_code: valor lido de ic_id:<id>)
+    """
+    keys = [f"ic_id:{competition_id}"]
+    if invite_code:
+        keys.append(f"ic:{invite_code.decode('utf-8')}")
+    return keys
+
+def _invalidate_competition_cache(db: Session, competition_id: str):
+    """
+    Remove a competição dos caches da sessão, do processo e do Redis (cacheada pelo código de convite)
+    """
+    _session_cache_clear(db, *COMPETITION_SESSION_CACHES)
+    invalidate(db.info, _competition_cache_keys(competition_id, cache_get(f"ic_id:{competition_id}")),
+               [invite_code_cache])
+
+competition_crud = Crud(Competition, CompetitionReadDTO, "competição", "competition_id",
+                       describe=lambda competition: {"name": competition.name},
+                       on_change=_invalidate_competition_cache)
+get_competition_by_id = session_memoize("competition_by_id")(competition_crud.get_by_id)
+delete_competition = competition_crud.delete
+
+@db_op("CREATE", "competitions", "competição",
+       fields=lambda dto: {"name": dto.name, "organizer": dto.organizer, "invite_code": dto.invite_code},
+       describe=lambda competition: {"competition_id": competition.id,
+                                     "name": competition.name,
+                                     "organizer": competition.organizer})
 def create_competition(db: Session, competition_dto: CompetitionCreateDTO) -> CompetitionReadDTO:
     """
     Cria uma nova competição no banco de dados
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de competição no banco de dados", 
-                   name=competition_dto.name,
-                   organizer=competition_dto.organizer,
-                   invite_code=competition_dto.invite_code)
+    # Converter strings de data para objetos datetime (fromisoformat aceita o sufixo Z)
+    start_date = datetime.fromisoformat(competition_dto.start_date)
+    end_date = datetime.fromisoformat(competition_dto.end_date)
     
-    try:
-        # Converter strings de data para objetos datetime
-        from datetime import datetime
-        start_date = datetime.fromisoformat(competition_dto.start_date.replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(competition_dto.end_date.replace('Z', '+00:00'))
-        
-        competition = Competition(
-            name=competition_dto.name,
-            organizer=competition_dto.organizer,
-            invite_code=competition_dto.invite_code,
-            start_date=start_date,
-            end_date=end_date
-        )
-        db.add(competition)
-        db.commit()
-        db.refresh(competition)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "competitions", duration, 
-                              competition_id=competition.id,
-                              name=competition.name,
-                              organizer=competition.organizer)
-        
-        return CompetitionReadDTO(
-            id=competition.id,
-            name=competition.name,
-            organizer=competition.organizer,
-            invite_code=competition.invite_code,
-            start_date=competition.start_date.isoformat(),
-            end_date=competition.end_date.isoformat()
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar competição no banco de dados", 
-                       error=str(e),
-                       name=competition_dto.name,
-                       organizer=competition_dto.organizer,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    competition = _insert_returning(db, Competition, {
+        "name": competition_dto.name,
+        "organizer": competition_dto.organizer,
+        "invite_code": competition_dto.invite_code,
+        "start_date": start_date,
+        "end_date": end_date
+    }, CompetitionReadDTO)
+    db.flush()
+    _session_cache_clear(db, *COMPETITION_SESSION_CACHES)
+    return competition
 
 def update_competition(db: Session, competition_id: str, competition_dto: CompetitionCreateDTO) -> CompetitionReadDTO:
     """
     Atualiza uma competição existente
     """
-    competition = db.query(Competition).filter(Competition.id == competition_id).first()
-    if not competition:
-        return None
-    
-    # Converter strings de data para objetos datetime
-    from datetime import datetime
-    start_date = datetime.fromisoformat(competition_dto.start_date.replace('Z', '+00:00'))
-    end_date = datetime.fromisoformat(competition_dto.end_date.replace('Z', '+00:00'))
-    
-    competition.name = competition_dto.name
-    competition.organizer = competition_dto.organizer
-    competition.invite_code = competition_dto.invite_code
-    competition.start_date = start_date
-    competition.end_date = end_date
-    
-    db.commit()
-    db.refresh(competition)
+    # Converter strings de data para objetos datetime (fromisoformat aceita o sufixo Z)
+    start_date = datetime.fromisoformat(competition_dto.start_date)
+    end_date = datetime.fromisoformat(competition_dto.end_date)
     
-    return CompetitionReadDTO(
-        id=competition.id,
-        name=competition.name,
-        organizer=competition.organizer,
-        invite_code=competition.invite_code,
-        start_date=competition.start_date.isoformat(),
-        end_date=competition.end_date.isoformat()
-    )
+    values = {
+        "name": competition_dto.name,
+        "organizer": competition_dto.organizer,
+        "invite_code": competition_dto.invite_code,
+        "start_date": start_date,
+        "end_date": end_date
+    }
+    return competition_crud.update(db, competition_id, values)
 
-def delete_competition(db: Session, competition_id: str) -> bool:
-    """
-    Deleta uma competição do banco de dados
-    """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de competição no banco de dados", 
-                   competition_id=competition_id)
-    
-    try:
-        competition = db.query(Competition).filter(Competition.id == competition_id).first()
-        if not competition:
-            db_logger.warning("Tentativa de deletar competição inexistente", 
-                             competition_id=competition_id)
-            return False
-        
-        db.delete(competition)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "competitions", duration, 
-                              competition_id=competition_id,
-                              name=competition.name)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar competição no banco de dados", 
-                       error=str(e),
-                       competition_id=competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+exercise_crud = Crud(Exercise, ExerciseReadDTO, "exercício", "exercise_id",
+                     describe=lambda exercise: {"name": exercise.name})
+get_exercise_by_id = exercise_crud.get_by_id
+delete_exercise = exercise_crud.delete
 
-def get_exercise_by_id(db: Session, exercise_id: str) -> ExerciseReadDTO:
+@db_op("CREATE", "exercises", "exercício",
+       fields=lambda dto: {"name": dto.name, "difficulty": dto.difficulty},
+       describe=lambda exercise: {"exercise_id": exercise.id,
+                                  "name": exercise.name,
+                                  "difficulty": exercise.difficulty})
+def create_exercise(db: Session, exercise_dto: ExerciseCreateDTO) -> ExerciseReadDTO:
     """
-    Busca um exercício pelo ID
+    Cria um novo exercício no banco de dados
     """
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-    if exercise:
-        return ExerciseReadDTO(
-            id=exercise.id,
-            link=exercise.link,
-            name=exercise.name,
-            score=exercise.score,
-            difficulty=exercise.difficulty,
-            port=exercise.port 
-        )
-    return None
+    exercise = _insert_returning(db, Exercise, {
+        "link": exercise_dto.link,
+        "name": exercise_dto.name,
+        "score": exercise_dto.score,
+        "difficulty": exercise_dto.difficulty,
+        "port": exercise_dto.port
+    }, ExerciseReadDTO)
+    db.flush()
+    return exercise
 
-def create_exercise(db: Session, exercise_dto: ExerciseCreateDTO) -> ExerciseReadDTO:
+def create_exercises_bulk(db: Session, exercise_dtos: List[ExerciseCreateDTO]) -> List[ExerciseReadDTO]:
     """
-    Cria um novo exercício no banco de dados
+    Cria vários exercícios com um único INSERT em lote
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de exercício no banco de dados", 
-                   name=exercise_dto.name,
-                   difficulty=exercise_dto.difficulty)
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando criação em lote de exercícios no banco de dados", 
+                   total=len(exercise_dtos))
     
     try:
-        exercise = Exercise(
-            link=exercise_dto.link,
-            name=exercise_dto.name,
-            score=exercise_dto.score,
-            difficulty=exercise_dto.difficulty,
-            port=exercise_dto.port
-        )
-        db.add(exercise)
-        db.commit()
-        db.refresh(exercise)
+        rows = [{"id": new_uuid(), **dto.model_dump()} for dto in exercise_dtos]
+        for chunk in _chunks(rows):
+            db.execute(insert(Exercise), chunk)
+        db.flush()
         
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "exercises", duration, 
-                              exercise_id=exercise.id,
-                              name=exercise.name,
-                              difficulty=exercise.difficulty)
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database("CREATE", "exercises", duration_ns, 
+                              total=len(rows))
         
-        return ExerciseReadDTO(
-            id=exercise.id,
-            link=exercise.link,
-            name=exercise.name,
-            score=exercise.score,
-            difficulty=exercise.difficulty,
-            port=exercise.port
-        )
+        return [_to_dto(ExerciseReadDTO, row) for row in rows]
     
     except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar exercício no banco de dados", 
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao criar exercícios em lote no banco de dados", 
                        error=str(e),
-                       name=exercise_dto.name,
-                       difficulty=exercise_dto.difficulty,
-                       duration_ms=round(duration * 1000, 2))
+                       total=len(exercise_dtos),
+                       duration_ms=ns_to_ms(duration_ns))
         raise e
 
 def update_exercise(db: Session, exercise_id: str, exercise_dto: ExerciseCreateDTO) -> ExerciseReadDTO:
     """
     Atualiza um exercício existente
     """
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-    if not exercise:
-        return None
-    
-    exercise.link = exercise_dto.link
-    exercise.name = exercise_dto.name
-    exercise.score = exercise_dto.score
-    exercise.difficulty = exercise_dto.difficulty
-    exercise.port = exercise_dto.port
-    
-    db.commit()
-    db.refresh(exercise)
-    
-    return ExerciseReadDTO(
-        id=exercise.id,
-        link=exercise.link,
-        name=exercise.name,
-        score=exercise.score,
-        difficulty=exercise.difficulty,
-        port=exercise.port          
-    )
+    return exercise_crud.update(db, exercise_id, exercise_dto.model_dump())
 
-def delete_exercise(db: Session, exercise_id: str) -> bool:
+def _invalidate_tag_cache(db: Session, tag_id: str):
     """
-    Deleta um exercício do banco de dados
+    Limpa o cache de tags por tipo da sessão e do processo após uma escrita
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de exercício no banco de dados", 
-                   exercise_id=exercise_id)
-    
-    try:
-        exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
-        if not exercise:
-            db_logger.warning("Tentativa de deletar exercício inexistente", 
-                             exercise_id=exercise_id)
-            return False
-        
-        db.delete(exercise)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "exercises", duration, 
-                              exercise_id=exercise_id,
-                              name=exercise.name)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar exercício no banco de dados", 
-                       error=str(e),
-                       exercise_id=exercise_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    _session_cache_clear(db, "tag_by_type")
+    invalidate(db.info, local=[tag_type_cache])
 
-def get_tag_by_id(db: Session, tag_id: str) -> TagReadDTO:
-    """
-    Busca uma tag pelo ID
-    """
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
-    if tag:
-        return TagReadDTO(id=tag.id, type=tag.type)
-    return None
+tag_crud = Crud(Tag, TagReadDTO, "tag", "tag_id",
+                describe=lambda tag: {"type": tag.type},
+                on_change=_invalidate_tag_cache)
+get_tag_by_id = tag_crud.get_by_id
+delete_tag = tag_crud.delete
 
+@session_memoize("tag_by_type")
 def get_tag_by_type(db: Session, tag_type: str) -> TagReadDTO:
     """
     Busca uma tag pelo tipo
     """
-    tag = db.query(Tag).filter(Tag.type == tag_type).first()
+    tag = tag_type_cache.get(tag_type)
     if tag:
-        return TagReadDTO(id=tag.id, type=tag.type)
+        return tag
+
+    row = db.execute(_SEL_TAG_BY_TYPE, {"tag_type": tag_type}).first()
+    if row:
+        tag = TagReadDTO.model_construct(**row._mapping)
+        tag_type_cache.put(tag_type, tag)
+        return tag
     return None
 
+@db_op("CREATE", "tags", "tag",
+       fields=lambda dto: {"type": dto.type},
+       describe=lambda tag: {"tag_id": tag.id, "type": tag.type})
 def create_tag(db: Session, tag_dto: TagCreateDTO) -> TagReadDTO:
     """
     Cria uma nova tag no banco de dados
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de tag no banco de dados", 
-                   type=tag_dto.type)
-    
-    try:
-        tag = Tag(type=tag_dto.type)
-        db.add(tag)
-        db.commit()
-        db.refresh(tag)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "tags", duration, 
-                              tag_id=tag.id,
-                              type=tag.type)
-        
-        return TagReadDTO(id=tag.id, type=tag.type)
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar tag no banco de dados", 
-                       error=str(e),
-                       type=tag_dto.type,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    tag = _insert_returning(db, Tag, {"type": tag_dto.type}, TagReadDTO)
+    db.flush()
+    _session_cache_clear(db, "tag_by_type")
+    return tag
 
 def update_tag(db: Session, tag_id: str, tag_dto: TagCreateDTO) -> TagReadDTO:
     """
     Atualiza uma tag existente
     """
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
-    if not tag:
-        return None
-    
-    tag.type = tag_dto.type
-    db.commit()
-    db.refresh(tag)
-    
-    return TagReadDTO(id=tag.id, type=tag.type)
-
-def delete_tag(db: Session, tag_id: str) -> bool:
-    """
-    Deleta uma tag do banco de dados
-    """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de tag no banco de dados", 
-                   tag_id=tag_id)
-    
-    try:
-        tag = db.query(Tag).filter(Tag.id == tag_id).first()
-        if not tag:
-            db_logger.warning("Tentativa de deletar tag inexistente", 
-                             tag_id=tag_id)
-            return False
-        
-        db.delete(tag)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "tags", duration, 
-                              tag_id=tag_id,
-                              type=tag.type)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar tag no banco de dados", 
-                       error=str(e),
-                       tag_id=tag_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return tag_crud.update(db, tag_id, {"type": tag_dto.type})
 
-def get_team_by_id(db: Session, team_id: str) -> TeamReadDTO:
-    """
-    Busca um time pelo ID
-    """
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if team:
-        return TeamReadDTO(
-            id=team.id,
-            name=team.name,
-            competition=team.competition,
-            creator=team.creator,
-            score=team.score
-        )
-    return None
+team_crud = Crud(Team, TeamReadDTO, "time", "team_id",
+                 describe=lambda team: {"name": team.name})
+get_team_by_id = team_crud.get_by_id
+delete_team = team_crud.delete
 
+@db_op("CREATE", "teams", "time",
+       fields=lambda dto: {"name": dto.name, "competition": dto.competition},
+       describe=lambda team: {"team_id": team.id, "name": team.name, "competition": team.competition})
 def create_team(db: Session, team_dto: TeamCreateDTO) -> TeamReadDTO:
     """
     Cria um novo time no banco de dados
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de time no banco de dados", 
-                   name=team_dto.name,
-                   competition=team_dto.competition)
-    
-    try:
-        team = Team(
-            name=team_dto.name,
-            competition=team_dto.competition,
-            creator=team_dto.creator,
-            score=team_dto.score
-        )
-        db.add(team)
-        db.commit()
-        db.refresh(team)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "teams", duration, 
-                              team_id=team.id,
-                              name=team.name,
-                              competition=team.competition)
-        
-        return TeamReadDTO(
-            id=team.id,
-            name=team.name,
-            competition=team.competition,
-            creator=team.creator,
-            score=team.score
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar time no banco de dados", 
-                       error=str(e),
-                       name=team_dto.name,
-                       competition=team_dto.competition,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    team = _insert_returning(db, Team, {
+        "name": team_dto.name,
+        "competition": team_dto.competition,
+        "creator": team_dto.creator,
+        "score": team_dto.score
+    }, TeamReadDTO)
+    db.flush()
+    return team
 
 def update_team(db: Session, team_id: str, team_dto: TeamCreateDTO) -> TeamReadDTO:
     """
     Atualiza um time existente
     """
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if not team:
-        return None
-    
-    team.name = team_dto.name
-    team.competition = team_dto.competition
-    team.creator = team_dto.creator
-    team.score = team_dto.score
-    
-    db.commit()
-    db.refresh(team)
-    
-    return TeamReadDTO(
-        id=team.id,
-        name=team.name,
-        competition=team.competition,
-        creator=team.creator,
-        score=team.score
-    )
+    return team_crud.update(db, team_id, team_dto.model_dump())
 
-def delete_team(db: Session, team_id: str) -> bool:
-    """
-    Deleta um time do banco de dados
-    """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de time no banco de dados", 
-                   team_id=team_id)
-    
-    try:
-        team = db.query(Team).filter(Team.id == team_id).first()
-        if not team:
-            db_logger.warning("Tentativa de deletar time inexistente", 
-                             team_id=team_id)
-            return False
-        
-        db.delete(team)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "teams", duration, 
-                              team_id=team_id,
-                              name=team.name)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar time no banco de dados", 
-                       error=str(e),
-                       team_id=team_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
-
-def get_container_by_id(db: Session, container_id: str) -> ContainerReadDTO:
-    """
-    Busca um container pelo ID
-    """
-    container = db.query(Container).filter(Container.id == container_id).first()
-    if container:
-        return ContainerReadDTO(id=container.id, deadline=container.deadline.isoformat())
-    return None
+container_crud = Crud(Container, ContainerReadDTO, "container", "container_id",
+                      describe=lambda container: {"deadline": container.deadline.isoformat()})
+get_container_by_id = container_crud.get_by_id
+delete_container = container_crud.delete
 
+@db_op("CREATE", "containers", "container",
+       fields=lambda dto: {"deadline": dto.deadline},
+       describe=lambda container: {"container_id": container.id,
+                                   "deadline": container.deadline.isoformat()})
 def create_container(db: Session, container_dto: ContainerCreateDTO) -> ContainerReadDTO:
     """
     Cria um novo container no banco de dados
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de container no banco de dados", 
-                   deadline=container_dto.deadline)
+    # Converter string de data para objeto datetime (fromisoformat aceita o sufixo Z)
+    deadline = datetime.fromisoformat(container_dto.deadline)
     
-    try:
-        # Converter string de data para objeto datetime
-        from datetime import datetime
-        deadline = datetime.fromisoformat(container_dto.deadline.replace('Z', '+00:00'))
-        
-        container = Container(deadline=deadline)
-        db.add(container)
-        db.commit()
-        db.refresh(container)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "containers", duration, 
-                              container_id=container.id,
-                              deadline=container.deadline.isoformat())
-        
-        return ContainerReadDTO(id=container.id, deadline=container.deadline.isoformat())
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar container no banco de dados", 
-                       error=str(e),
-                       deadline=container_dto.deadline,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    container = _insert_returning(db, Container, {"deadline": deadline}, ContainerReadDTO)
+    db.flush()
+    return container
 
 def update_container(db: Session, container_id: str, container_dto: ContainerCreateDTO) -> ContainerReadDTO:
     """
     Atualiza um container existente
     """
-    container = db.query(Container).filter(Container.id == container_id).first()
-    if not container:
-        return None
-    
-    # Converter string de data para objeto datetime
-    from datetime import datetime
-    deadline = datetime.fromisoformat(container_dto.deadline.replace('Z', '+00:00'))
-    
-    container.deadline = deadline
-    db.commit()
-    db.refresh(container)
+    # Converter string de data para objeto datetime (fromisoformat aceita o sufixo Z)
+    deadline = datetime.fromisoformat(container_dto.deadline)
     
-    return ContainerReadDTO(id=container.id, deadline=container.deadline.isoformat())
+    return container_crud.update(db, container_id, {"deadline": deadline})
 
-def delete_container(db: Session, container_id: str) -> bool:
+def create_relationship(db: Session, model, label: str, relationship_dto: BaseModel) -> BaseModel:
     """
-    Deleta um container do banco de dados
+    Cria um relacionamento em uma tabela de associação (INSERT comum)
+    Retorna None quando o relacionamento já existe (chave única); outros erros são relançados
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de container no banco de dados", 
-                   container_id=container_id)
+    keys = relationship_dto.model_dump()
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando criação de relacionamento %s", label, **keys)
     
     try:
-        container = db.query(Container).filter(Container.id == container_id).first()
-        if not container:
-            db_logger.warning("Tentativa de deletar container inexistente", 
-                             container_id=container_id)
-            return False
-        
-        db.delete(container)
-        db.commit()
+        try:
+            db.execute(_ASSOC_INSERT[model], keys)
+        except IntegrityError as e:
+            if not is_duplicate_key(e):
+                raise e
+            db_logger.warning("Relacionamento %s já existe", label, **keys)
+            return None
+        db.flush()
         
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "containers", duration, 
-                              container_id=container_id,
-                              deadline=container.deadline.isoformat())
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database_batched("CREATE", model.__tablename__, duration_ns, **keys)
         
-        return True
+        return relationship_dto
     
     except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar container no banco de dados", 
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao criar relacionamento %s", label, 
                        error=str(e),
-                       container_id=container_id,
-                       duration_ms=round(duration * 1000, 2))
+                       duration_ms=ns_to_ms(duration_ns),
+                       **keys)
         raise e
 
-def create_user_competition(db: Session, user_competition_dto: UserCompetitionCreateDTO) -> UserCompetitionCreateDTO:
+def create_relationships_bulk(db: Session, model, label: str, relationship_dtos: List[BaseModel]) -> int:
     """
-    Cria um relacionamento usuário-competição
+    Cria vários relacionamentos em uma tabela de associação com um INSERT em lote
+    Relacionamentos já existentes são ignorados; retorna a quantidade inserida
+    IDs inexistentes (FK) levantam IntegrityError e abortam o lote
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de relacionamento usuário-competição", 
-                   user_id=user_competition_dto.user_id,
-                   competition_id=user_competition_dto.competition_id)
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando criação em lote de relacionamentos %s", label, 
+                   total=len(relationship_dtos))
     
     try:
-        existing = db.query(UserCompetition).filter(
-            UserCompetition.user_id == user_competition_dto.user_id,
-            UserCompetition.competition_id == user_competition_dto.competition_id
-        ).first()
-        if existing:
-            db_logger.warning("Relacionamento usuário-competição já existe", 
-                             user_id=user_competition_dto.user_id,
-                             competition_id=user_competition_dto.competition_id)
-            return None
-        
-        user_competition = UserCompetition(
-            user_id=user_competition_dto.user_id,
-            competition_id=user_competition_dto.competition_id
-        )
-        db.add(user_competition)
-        db.commit()
-        db.refresh(user_competition)
+        inserted = _insert_ignore_duplicates(db, model, [dto.model_dump() for dto in relationship_dtos])
+        db.flush()
         
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "user_competitions", duration, 
-                              user_id=user_competition.user_id,
-                              competition_id=user_competition.competition_id)
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database("CREATE", model.__tablename__, duration_ns, 
+                              total=len(relationship_dtos),
+                              inserted=inserted)
         
-        return UserCompetitionCreateDTO(
-            user_id=user_competition.user_id,
-            competition_id=user_competition.competition_id
-        )
+        return inserted
     
     except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar relacionamento usuário-competição", 
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao criar relacionamentos %s em lote", label, 
                        error=str(e),
-                       user_id=user_competition_dto.user_id,
-                       competition_id=user_competition_dto.competition_id,
-                       duration_ms=round(duration * 1000, 2))
+                       total=len(relationship_dtos),
+                       duration_ms=ns_to_ms(duration_ns))
         raise e
 
-def delete_user_competition(db: Session, user_id: str, competition_id: str) -> bool:
+def delete_relationship(db: Session, model, label: str, **keys) -> bool:
     """
-    Deleta um relacionamento usuário-competição
+    Deleta um relacionamento de uma tabela de associação pelas suas chaves
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de relacionamento usuário-competição", 
-                   user_id=user_id,
-                   competition_id=competition_id)
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando deleção de relacionamento %s", label, **keys)
     
     try:
-        user_competition = db.query(UserCompetition).filter(
-            UserCompetition.user_id == user_id,
-            UserCompetition.competition_id == competition_id
-        ).first()
-        if not user_competition:
-            db_logger.warning("Relacionamento usuário-competição não encontrado", 
-                             user_id=user_id,
-                             competition_id=competition_id)
+        #DELETE direto; rowcount indica se o relacionamento existia
+        result = db.execute(_ASSOC_DELETE[model], keys)
+        if not result.rowcount:
+            db_logger.warning("Relacionamento %s não encontrado", label, **keys)
             return False
         
-        db.delete(user_competition)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "user_competitions", duration, 
-                              user_id=user_id,
-                              competition_id=competition_id)
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database_batched("DELETE", model.__tablename__, duration_ns, **keys)
         
         return True
     
     except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar relacionamento usuário-competição", 
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao deletar relacionamento %s", label, 
                        error=str(e),
-                       user_id=user_id,
-                       competition_id=competition_id,
-                       duration_ms=round(duration * 1000, 2))
+                       duration_ms=ns_to_ms(duration_ns),
+                       **keys)
         raise e
 
+def create_user_competition(db: Session, user_competition_dto: UserCompetitionCreateDTO) -> UserCompetitionCreateDTO:
+    """
+    Cria um relacionamento usuário-competição
+    """
+    return create_relationship(db, UserCompetition, "usuário-competição", user_competition_dto)
+
+def create_user_competitions_bulk(db: Session, user_competition_dtos: List[UserCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos usuário-competição em um único INSERT
+    """
+    return create_relationships_bulk(db, UserCompetition, "usuário-competição", user_competition_dtos)
+
+def delete_user_competition(db: Session, user_id: str, competition_id: str) -> bool:
+    """
+    Deleta um relacionamento usuário-competição
+    """
+    return delete_relationship(db, UserCompetition, "usuário-competição", user_id=user_id, competition_id=competition_id)
+
 def create_user_team(db: Session, user_team_dto: UserTeamCreateDTO) -> UserTeamCreateDTO:
     """
     Cria um relacionamento usuário-time
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de relacionamento usuário-time", 
-                   user_id=user_team_dto.user_id,
-                   team_id=user_team_dto.team_id)
-    
-    try:
-        existing = db.query(UserTeam).filter(
-            UserTeam.user_id == user_team_dto.user_id,
-            UserTeam.team_id == user_team_dto.team_id
-        ).first()
-        if existing:
-            db_logger.warning("Relacionamento usuário-time já existe", 
-                             user_id=user_team_dto.user_id,
-                             team_id=user_team_dto.team_id)
-            return None
-        
-        user_team = UserTeam(
-            user_id=user_team_dto.user_id,
-            team_id=user_team_dto.team_id
-        )
-        db.add(user_team)
-        db.commit()
-        db.refresh(user_team)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "user_teams", duration, 
-                              user_id=user_team.user_id,
-                              team_id=user_team.team_id)
-        
-        return UserTeamCreateDTO(
-            user_id=user_team.user_id,
-            team_id=user_team.team_id
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar relacionamento usuário-time", 
-                       error=str(e),
-                       user_id=user_team_dto.user_id,
-                       team_id=user_team_dto.team_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return create_relationship(db, UserTeam, "usuário-time", user_team_dto)
+
+def create_user_teams_bulk(db: Session, user_team_dtos: List[UserTeamCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos usuário-time em um único INSERT
+    """
+    return create_relationships_bulk(db, UserTeam, "usuário-time", user_team_dtos)
 
 def delete_user_team(db: Session, user_id: str, team_id: str) -> bool:
     """
     Deleta um relacionamento usuário-time
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de relacionamento usuário-time", 
-                   user_id=user_id,
-                   team_id=team_id)
-    
-    try:
-        user_team = db.query(UserTeam).filter(
-            UserTeam.user_id == user_id,
-            UserTeam.team_id == team_id
-        ).first()
-        if not user_team:
-            db_logger.warning("Relacionamento usuário-time não encontrado", 
-                             user_id=user_id,
-                             team_id=team_id)
-            return False
-        
-        db.delete(user_team)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "user_teams", duration, 
-                              user_id=user_id,
-                              team_id=team_id)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar relacionamento usuário-time", 
-                       error=str(e),
-                       user_id=user_id,
-                       team_id=team_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return delete_relationship(db, UserTeam, "usuário-time", user_id=user_id, team_id=team_id)
 
 def create_team_competition(db: Session, team_competition_dto: TeamCompetitionCreateDTO) -> TeamCompetitionCreateDTO:
     """
     Cria um relacionamento time-competição
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de relacionamento time-competição", 
-                   team_id=team_competition_dto.team_id,
-                   competition_id=team_competition_dto.competition_id)
-    
-    try:
-        existing = db.query(TeamCompetition).filter(
-            TeamCompetition.team_id == team_competition_dto.team_id,
-            TeamCompetition.competition_id == team_competition_dto.competition_id
-        ).first()
-        if existing:
-            db_logger.warning("Relacionamento time-competição já existe", 
-                             team_id=team_competition_dto.team_id,
-                             competition_id=team_competition_dto.competition_id)
-            return None
-        
-        team_competition = TeamCompetition(
-            team_id=team_competition_dto.team_id,
-            competition_id=team_competition_dto.competition_id
-        )
-        db.add(team_competition)
-        db.commit()
-        db.refresh(team_competition)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "team_competitions", duration, 
-                              team_id=team_competition.team_id,
-                              competition_id=team_competition.competition_id)
-        
-        return TeamCompetitionCreateDTO(
-            team_id=team_competition.team_id,
-            competition_id=team_competition.competition_id
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar relacionamento time-competição", 
-                       error=str(e),
-                       team_id=team_competition_dto.team_id,
-                       competition_id=team_competition_dto.competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return create_relationship(db, TeamCompetition, "time-competição", team_competition_dto)
+
+def create_team_competitions_bulk(db: Session, team_competition_dtos: List[TeamCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos time-competição em um único INSERT
+    """
+    return create_relationships_bulk(db, TeamCompetition, "time-competição", team_competition_dtos)
 
 def delete_team_competition(db: Session, team_id: str, competition_id: str) -> bool:
     """
     Deleta um relacionamento time-competição
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de relacionamento time-competição", 
-                   team_id=team_id,
-                   competition_id=competition_id)
-    
-    try:
-        team_competition = db.query(TeamCompetition).filter(
-            TeamCompetition.team_id == team_id,
-            TeamCompetition.competition_id == competition_id
-        ).first()
-        if not team_competition:
-            db_logger.warning("Relacionamento time-competição não encontrado", 
-                             team_id=team_id,
-                             competition_id=competition_id)
-            return False
-        
-        db.delete(team_competition)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "team_competitions", duration, 
-                              team_id=team_id,
-                              competition_id=competition_id)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar relacionamento time-competição", 
-                       error=str(e),
-                       team_id=team_id,
-                       competition_id=competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return delete_relationship(db, TeamCompetition, "time-competição", team_id=team_id, competition_id=competition_id)
 
 def create_exercise_tag(db: Session, exercise_tag_dto: ExerciseTagCreateDTO) -> ExerciseTagCreateDTO:
     """
     Cria um relacionamento exercício-tag
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de relacionamento exercício-tag", 
-                   exercise_id=exercise_tag_dto.exercise_id,
-                   tag_id=exercise_tag_dto.tag_id)
-    
-    try:
-        existing = db.query(ExerciseTag).filter(
-            ExerciseTag.exercise_id == exercise_tag_dto.exercise_id,
-            ExerciseTag.tag_id == exercise_tag_dto.tag_id
-        ).first()
-        if existing:
-            db_logger.warning("Relacionamento exercício-tag já existe", 
-                             exercise_id=exercise_tag_dto.exercise_id,
-                             tag_id=exercise_tag_dto.tag_id)
-            return None
-        
-        exercise_tag = ExerciseTag(
-            exercise_id=exercise_tag_dto.exercise_id,
-            tag_id=exercise_tag_dto.tag_id
-        )
-        db.add(exercise_tag)
-        db.commit()
-        db.refresh(exercise_tag)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "exercise_tags", duration, 
-                              exercise_id=exercise_tag.exercise_id,
-                              tag_id=exercise_tag.tag_id)
-        
-        return ExerciseTagCreateDTO(
-            exercise_id=exercise_tag.exercise_id,
-            tag_id=exercise_tag.tag_id
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar relacionamento exercício-tag", 
-                       error=str(e),
-                       exercise_id=exercise_tag_dto.exercise_id,
-                       tag_id=exercise_tag_dto.tag_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return create_relationship(db, ExerciseTag, "exercício-tag", exercise_tag_dto)
+
+def create_exercise_tags_bulk(db: Session, exercise_tag_dtos: List[ExerciseTagCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos exercício-tag em um único INSERT
+    """
+    return create_relationships_bulk(db, ExerciseTag, "exercício-tag", exercise_tag_dtos)
 
 def delete_exercise_tag(db: Session, exercise_id: str, tag_id: str) -> bool:
     """
     Deleta um relacionamento exercício-tag
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de relacionamento exercício-tag", 
-                   exercise_id=exercise_id,
-                   tag_id=tag_id)
-    
-    try:
-        exercise_tag = db.query(ExerciseTag).filter(
-            ExerciseTag.exercise_id == exercise_id,
-            ExerciseTag.tag_id == tag_id
-        ).first()
-        if not exercise_tag:
-            db_logger.warning("Relacionamento exercício-tag não encontrado", 
-                             exercise_id=exercise_id,
-                             tag_id=tag_id)
-            return False
-        
-        db.delete(exercise_tag)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "exercise_tags", duration, 
-                              exercise_id=exercise_id,
-                              tag_id=tag_id)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar relacionamento exercício-tag", 
-                       error=str(e),
-                       exercise_id=exercise_id,
-                       tag_id=tag_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return delete_relationship(db, ExerciseTag, "exercício-tag", exercise_id=exercise_id, tag_id=tag_id)
 
 def create_exercise_competition(db: Session, exercise_competition_dto: ExerciseCompetitionCreateDTO) -> ExerciseCompetitionCreateDTO:
     """
     Cria um relacionamento exercício-competição
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de relacionamento exercício-competição", 
-                   exercise_id=exercise_competition_dto.exercise_id,
-                   competition_id=exercise_competition_dto.competition_id)
-    
-    try:
-        existing = db.query(ExerciseCompetition).filter(
-            ExerciseCompetition.exercise_id == exercise_competition_dto.exercise_id,
-            ExerciseCompetition.competition_id == exercise_competition_dto.competition_id
-        ).first()
-        if existing:
-            db_logger.warning("Relacionamento exercício-competição já existe", 
-                             exercise_id=exercise_competition_dto.exercise_id,
-                             competition_id=exercise_competition_dto.competition_id)
-            return None
-        
-        exercise_competition = ExerciseCompetition(
-            exercise_id=exercise_competition_dto.exercise_id,
-            competition_id=exercise_competition_dto.competition_id
-        )
-        db.add(exercise_competition)
-        db.commit()
-        db.refresh(exercise_competition)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "exercise_competitions", duration, 
-                              exercise_id=exercise_competition.exercise_id,
-                              competition_id=exercise_competition.competition_id)
-        
-        return ExerciseCompetitionCreateDTO(
-            exercise_id=exercise_competition.exercise_id,
-            competition_id=exercise_competition.competition_id
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar relacionamento exercício-competição", 
-                       error=str(e),
-                       exercise_id=exercise_competition_dto.exercise_id,
-                       competition_id=exercise_competition_dto.competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return create_relationship(db, ExerciseCompetition, "exercício-competição", exercise_competition_dto)
+
+def create_exercise_competitions_bulk(db: Session, exercise_competition_dtos: List[ExerciseCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos exercício-competição em um único INSERT
+    """
+    return create_relationships_bulk(db, ExerciseCompetition, "exercício-competição", exercise_competition_dtos)
 
 def delete_exercise_competition(db: Session, exercise_id: str, competition_id: str) -> bool:
     """
     Deleta um relacionamento exercício-competição
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de relacionamento exercício-competição", 
-                   exercise_id=exercise_id,
-                   competition_id=competition_id)
-    
-    try:
-        exercise_competition = db.query(ExerciseCompetition).filter(
-            ExerciseCompetition.exercise_id == exercise_id,
-            ExerciseCompetition.competition_id == competition_id
-        ).first()
-        if not exercise_competition:
-            db_logger.warning("Relacionamento exercício-competição não encontrado", 
-                             exercise_id=exercise_id,
-                             competition_id=competition_id)
-            return False
-        
-        db.delete(exercise_competition)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "exercise_competitions", duration, 
-                              exercise_id=exercise_id,
-                              competition_id=competition_id)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar relacionamento exercício-competição", 
-                       error=str(e),
-                       exercise_id=exercise_id,
-                       competition_id=competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return delete_relationship(db, ExerciseCompetition, "exercício-competição", exercise_id=exercise_id, competition_id=competition_id)
 
 def create_container_competition(db: Session, container_competition_dto: ContainerCompetitionCreateDTO) -> ContainerCompetitionCreateDTO:
     """
     Cria um relacionamento container-competição
     """
-    start_time = time.time()
-    db_logger.info("Iniciando criação de relacionamento container-competição", 
-                   container_id=container_competition_dto.container_id,
-                   competition_id=container_competition_dto.competition_id)
-    
-    try:
-        existing = db.query(ContainerCompetition).filter(
-            ContainerCompetition.container_id == container_competition_dto.container_id,
-            ContainerCompetition.competition_id == container_competition_dto.competition_id
-        ).first()
-        if existing:
-            db_logger.warning("Relacionamento container-competição já existe", 
-                             container_id=container_competition_dto.container_id,
-                             competition_id=container_competition_dto.competition_id)
-            return None
-        
-        container_competition = ContainerCompetition(
-            container_id=container_competition_dto.container_id,
-            competition_id=container_competition_dto.competition_id
-        )
-        db.add(container_competition)
-        db.commit()
-        db.refresh(container_competition)
-        
-        duration = time.time() - start_time
-        db_logger.log_database("CREATE", "container_competitions", duration, 
-                              container_id=container_competition.container_id,
-                              competition_id=container_competition.competition_id)
-        
-        return ContainerCompetitionCreateDTO(
-            container_id=container_competition.container_id,
-            competition_id=container_competition.competition_id
-        )
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao criar relacionamento container-competição", 
-                       error=str(e),
-                       container_id=container_competition_dto.container_id,
-                       competition_id=container_competition_dto.competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
+    return create_relationship(db, ContainerCompetition, "container-competição", container_competition_dto)
+
+def create_container_competitions_bulk(db: Session, container_competition_dtos: List[ContainerCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos container-competição em um único INSERT
+    """
+    return create_relationships_bulk(db, ContainerCompetition, "container-competição", container_competition_dtos)
 
 def delete_container_competition(db: Session, container_id: str, competition_id: str) -> bool:
     """
     Deleta um relacionamento container-competição
     """
-    start_time = time.time()
-    db_logger.info("Iniciando deleção de relacionamento container-competição", 
-                   container_id=container_id,
-                   competition_id=competition_id)
-    
-    try:
-        container_competition = db.query(ContainerCompetition).filter(
-            ContainerCompetition.container_id == container_id,
-            ContainerCompetition.competition_id == competition_id
-        ).first()
-        if not container_competition:
-            db_logger.warning("Relacionamento container-competição não encontrado", 
-                             container_id=container_id,
-                             competition_id=competition_id)
-            return False
-        
-        db.delete(container_competition)
-        db.commit()
-        
-        duration = time.time() - start_time
-        db_logger.log_database("DELETE", "container_competitions", duration, 
-                              container_id=container_id,
-                              competition_id=competition_id)
-        
-        return True
-    
-    except Exception as e:
-        duration = time.time() - start_time
-        db_logger.error("Erro ao deletar relacionamento container-competição", 
-                       error=str(e),
-                       container_id=container_id,
-                       competition_id=competition_id,
-                       duration_ms=round(duration * 1000, 2))
-        raise e
\ No newline at end of file
+    return delete_relationship(db, ContainerCompetition, "container-competição", container_id=container_id, competition_id=competition_id)
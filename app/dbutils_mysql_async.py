@@ -0,0 +1,582 @@
+# dbutils_mysql_async.py
+#Variantes assíncronas (AsyncSession) das operações usadas pelas rotas
+#Usadas pelas rotas async para não bloquear o event loop durante o round-trip ao banco
+#Reaproveitam os statements pré-montados (inclusive os das tabelas de associação) e a configuração de Crud de dbutils_mysql;
+#escritas só fazem flush (get_async_db faz o commit). dbutils_mysql continua servindo scripts síncronos
+from sqlalchemy import bindparam, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import *
+from schemas import *
+from dbutils_mysql import (
+    COMPETITION_SESSION_CACHES, _ASSOC_COUNT_BY_IDS, _ASSOC_DELETE, _ASSOC_INSERT, _ASSOC_UPSERT,
+    _SEL_COMPETITION_BY_INVITE_CODE, _SEL_TAG_BY_TYPE, _SEL_USER_CONFLICT, _SEL_USER_FULL_BY_ID,
+    _chunks, _competition_cache_keys, _session_cache_clear, _to_dto, db_logger, db_op, is_duplicate_key,
+    pass_hasher, session_memoize,
+    invite_code_cache, tag_type_cache, competition_crud, container_crud, exercise_crud, tag_crud, team_crud
+)
+from cache import async_cache_get, async_cache_set, async_invalidate
+from datetime import datetime
+from typing import List, Optional, Tuple
+import asyncio
+import time
+from logger import ns_to_ms
+
+async def check_parents_exist(db: AsyncSession, *parents) -> Tuple[bool, ...]:
+    """
+    Verifica, em um único round-trip, se as entidades pai de um relacionamento existem
+    parents: pares (modelo, id); retorna um bool por par, na mesma ordem
+    SELECT EXISTS(...), EXISTS(...) - o banco devolve só as flags, sem ler colunas nem criar instâncias ORM
+    """
+    stmt = select(*[
+        select(literal(1)).where(model.id == bindparam(f"id_{index}")).exists()
+        for index, (model, _) in enumerate(parents)
+    ])
+    params = {f"id_{index}": entity_id for index, (_, entity_id) in enumerate(parents)}
+    row = (await db.execute(stmt, params)).one()
+    return tuple(bool(flag) for flag in row)
+
+async def _insert_returning(db: AsyncSession, model, values: dict, read_dto):
+    """
+    INSERT em um único round-trip retornando o DTO (ver dbutils_mysql._insert_returning)
+    """
+    if db.get_bind().dialect.insert_returning:
+        columns = [getattr(model, name) for name in read_dto.model_fields]
+        row = (await db.execute(insert(model).values(**values).returning(*columns))).one()
+        return _to_dto(read_dto, row)
+    result = await db.execute(insert(model).values(**values))
+    return _to_dto(read_dto, {"id": result.inserted_primary_key[0], **values})
+
+async def _insert_unique(db: AsyncSession, model, values: dict, read_dto):
+    """
+    INSERT em tabela com chave única (email, código de convite, tipo de tag) sem SELECT prévio
+    Retorna None quando o registro viola a chave única; o próprio banco resolve a corrida entre requisições
+    Um INSERT comum (e não IGNORE) mantém erros de truncamento/strict mode como erros, e qualquer
+    IntegrityError que não seja de chave duplicada (FK, NOT NULL) é relançado
+    """
+    try:
+        return await _insert_returning(db, model, values, read_dto)
+    except IntegrityError as e:
+        if not is_duplicate_key(e):
+            raise e
+        return None
+
+async def get_user_conflict(db: AsyncSession, email: str, username: str) -> Optional[str]:
+    """
+    Verifica, em um único round-trip pelos índices únicos, se o email ou o username já estão em uso
+    Retorna "email", "username" (o email tem prioridade) ou None quando ambos estão livres
+    """
+    row = (await db.execute(_SEL_USER_CONFLICT, {"email": email, "username": username})).one()
+    if row.email_taken:
+        return "email"
+    if row.username_taken:
+        return "username"
+    return None
+
+@db_op("CREATE", "users", "usuário",
+       fields=lambda dto: {"email": dto.email, "username": dto.username},
+       describe=lambda user: {"user_id": user.id, "email": user.email, "username": user.username})
+async def create_user(db: AsyncSession, userDTO: UserCreateDTO) -> UserReadDTO:
+    """
+    Cria um novo usuário no banco de dados; retorna None se o email ou o username já existir
+    O hash Argon2 (CPU, ~dezenas de ms) roda em uma thread para não travar o event loop; chame
+    get_user_conflict antes para não pagar o hash em registros duplicados
+    """
+    hashed_password = await asyncio.to_thread(pass_hasher, userDTO.password)
+    user = await _insert_unique(db, User, {
+        "username": userDTO.username,
+        "email": userDTO.email,
+        "password": hashed_password,
+        "phone_number": userDTO.phone_number
+    }, UserReadDTO)
+    if user is None:
+        return None
+    await db.flush()
+    return user
+
+async def get_user_by_id_full(db: AsyncSession, user_id: str) -> UserReadFullDTO:
+    """
+    Busca um usuário pelo ID com times (e suas competições) e competições
+    O selectinload carrega o grafo antes da validação, sem lazy load (proibido no AsyncSession)
+    """
+    user = (await db.scalars(_SEL_USER_FULL_BY_ID, {"user_id": user_id})).first()
+    if user:
+        return UserReadFullDTO.model_validate(user)
+    return None
+
+class AsyncCrud:
+    """
+    Operações por ID de uma entidade sobre AsyncSession
+    Usa a mesma configuração (modelo, DTO e campos de log) do Crud síncrono
+    Leituras por ID passam por um read-through no Redis (quando habilitado), chave <tabela>:<id>;
+    update e delete invalidam a chave após a escrita e de novo após o commit (ver cache.invalidate)
+    on_change: corrotina chamada após atualizar/deletar (invalidação de caches); o hook
+    síncrono do Crud não é usado aqui porque faz I/O bloqueante no Redis
+    """
+
+    def __init__(self, crud, on_change=None):
+        self.crud = crud
+        self.on_change = on_change
+
+    async def get_by_id(self, db: AsyncSession, entity_id: str):
+        """
+        Busca pelo ID (Redis, depois identity map da sessão, depois o banco)
+        Apenas entidades existentes são guardadas no cache
+        """
+        key = self.crud.cache_key(entity_id)
+        cached = await async_cache_get(key)
+        if cached:
+            return self.crud.read_dto.model_validate_json(cached)
+
+        entity = await db.get(self.crud.model, entity_id)
+        if entity:
+            dto = _to_dto(self.crud.read_dto, entity)
+            await async_cache_set(key, dto.model_dump_json())
+            return dto
+        return None
+
+    async def update(self, db: AsyncSession, entity_id: str, values: dict):
+        """
+        Atualiza pelo ID: UPDATE (rowcount 0 = ID inexistente, retorna None) e um SELECT
+        O DTO vem da linha relida após o UPDATE (ver Crud.update)
+        """
+        model = self.crud.model
+        result = await db.execute(update(model).where(model.id == entity_id).values(**values))
+        if not result.rowcount:
+            return None
+        await db.flush()
+        await async_invalidate(db.info, [self.crud.cache_key(entity_id)])
+        if self.on_change:
+            await self.on_change(db, entity_id)
+        
+        row = (await db.execute(self.crud.select_by_id, {"entity_id": entity_id})).one()
+        return _to_dto(self.crud.read_dto, row)
+
+    async def delete(self, db: AsyncSession, entity_id: str) -> bool:
+        """
+        Deleta pelo ID; retorna False se o ID não existir
+        """
+        crud = self.crud
+        ids = {crud.id_field: entity_id}
+        start_ns = time.perf_counter_ns()
+        db_logger.info("Iniciando deleção de %s no banco de dados", crud.label, **ids)
+        
+        try:
+            entity = await db.get(crud.model, entity_id)
+            if not entity:
+                db_logger.warning("Tentativa de deletar %s inexistente", crud.label, **ids)
+                return False
+            
+            await db.delete(entity)
+            await db.flush()
+            await async_invalidate(db.info, [self.crud.cache_key(entity_id)])
+            if self.on_change:
+                await self.on_change(db, entity_id)
+            
+            duration_ns = time.perf_counter_ns() - start_ns
+            db_logger.log_database("DELETE", crud.model.__tablename__, duration_ns, 
+                                  **ids,
+                                  **crud.describe(entity))
+            
+            return True
+        
+        except Exception as e:
+            duration_ns = time.perf_counter_ns() - start_ns
+            db_logger.error("Erro ao deletar %s no banco de dados", crud.label, 
+                           error=str(e),
+                           duration_ms=ns_to_ms(duration_ns),
+                           **ids)
+            raise e
+
+async def _invalidate_competition_cache(db: AsyncSession, competition_id: str):
+    """
+    Remove a competição dos caches da sessão, do processo e do Redis (versão assíncrona de
+    dbutils_mysql._invalidate_competition_cache)
+    """
+    _session_cache_clear(db, *COMPETITION_SESSION_CACHES)
+    invite_code = await async_cache_get(f"ic_id:{competition_id}")
+    await async_invalidate(db.info, _competition_cache_keys(competition_id, invite_code), [invite_code_cache])
+
+competition_async_crud = AsyncCrud(competition_crud, on_change=_invalidate_competition_cache)
+get_competition_by_id = session_memoize("competition_by_id")(competition_async_crud.get_by_id)
+delete_competition = competition_async_crud.delete
+
+@session_memoize("competition_by_invite_code")
+async def get_competition_by_invite_code(db: AsyncSession, invite_code: str) -> CompetitionReadDTO:
+    """
+    Busca uma competição pelo código de convite (mesmos caches da versão síncrona)
+    """
+    competition = invite_code_cache.get(invite_code)
+    if competition:
+        return competition
+
+    key = f"ic:{invite_code}"
+    cached = await async_cache_get(key)
+    if cached:
+        competition = CompetitionReadDTO.model_validate_json(cached)
+        invite_code_cache.put(invite_code, competition)
+        return competition
+
+    row = (await db.execute(_SEL_COMPETITION_BY_INVITE_CODE, {"invite_code": invite_code})).first()
+    if row:
+        competition = _to_dto(CompetitionReadDTO, row)
+        await async_cache_set(key, competition.model_dump_json())
+        await async_cache_set(f"ic_id:{competition.id}", invite_code)
+        invite_code_cache.put(invite_code, competition)
+        return competition
+    return None
+
+def _competition_values(competition_dto: CompetitionCreateDTO) -> dict:
+    """
+    Colunas da competição a partir do DTO (fromisoformat aceita o sufixo Z)
+    """
+    return {
+        "name": competition_dto.name,
+        "organizer": competition_dto.organizer,
+        "invite_code": competition_dto.invite_code,
+        "start_date": datetime.fromisoformat(competition_dto.start_date),
+        "end_date": datetime.fromisoformat(competition_dto.end_date)
+    }
+
+@db_op("CREATE", "competitions", "competição",
+       fields=lambda dto: {"name": dto.name, "organizer": dto.organizer, "invite_code": dto.invite_code},
+       describe=lambda competition: {"competition_id": competition.id,
+                                     "name": competition.name,
+                                     "organizer": competition.organizer})
+async def create_competition(db: AsyncSession, competition_dto: CompetitionCreateDTO) -> CompetitionReadDTO:
+    """
+    Cria uma nova competição no banco de dados; retorna None se o código de convite já existir
+    """
+    competition = await _insert_unique(db, Competition, _competition_values(competition_dto), CompetitionReadDTO)
+    if competition is None:
+        return None
+    await db.flush()
+    _session_cache_clear(db, *COMPETITION_SESSION_CACHES)
+    return competition
+
+async def update_competition(db: AsyncSession, competition_id: str, competition_dto: CompetitionCreateDTO) -> CompetitionReadDTO:
+    """
+    Atualiza uma competição existente
+    """
+    return await competition_async_crud.update(db, competition_id, _competition_values(competition_dto))
+
+exercise_async_crud = AsyncCrud(exercise_crud)
+get_exercise_by_id = exercise_async_crud.get_by_id
+delete_exercise = exercise_async_crud.delete
+
+@db_op("CREATE", "exercises", "exercício",
+       fields=lambda dto: {"name": dto.name, "difficulty": dto.difficulty},
+       describe=lambda exercise: {"exercise_id": exercise.id,
+                                  "name": exercise.name,
+                                  "difficulty": exercise.difficulty})
+async def create_exercise(db: AsyncSession, exercise_dto: ExerciseCreateDTO) -> ExerciseReadDTO:
+    """
+    Cria um novo exercício no banco de dados
+    """
+    exercise = await _insert_returning(db, Exercise, exercise_dto.model_dump(), ExerciseReadDTO)
+    await db.flush()
+    return exercise
+
+async def update_exercise(db: AsyncSession, exercise_id: str, exercise_dto: ExerciseCreateDTO) -> ExerciseReadDTO:
+    """
+    Atualiza um exercício existente
+    """
+    return await exercise_async_crud.update(db, exercise_id, exercise_dto.model_dump())
+
+async def _invalidate_tag_cache(db: AsyncSession, tag_id: str):
+    """
+    Limpa o cache de tags por tipo da sessão e do processo após uma escrita
+    """
+    _session_cache_clear(db, "tag_by_type")
+    await async_invalidate(db.info, local=[tag_type_cache])
+
+tag_async_crud = AsyncCrud(tag_crud, on_change=_invalidate_tag_cache)
+get_tag_by_id = tag_async_crud.get_by_id
+delete_tag = tag_async_crud.delete
+
+@session_memoize("tag_by_type")
+async def get_tag_by_type(db: AsyncSession, tag_type: str) -> TagReadDTO:
+    """
+    Busca uma tag pelo tipo (cache do processo antes do banco)
+    """
+    tag = tag_type_cache.get(tag_type)
+    if tag:
+        return tag
+
+    row = (await db.execute(_SEL_TAG_BY_TYPE, {"tag_type": tag_type})).first()
+    if row:
+        tag = _to_dto(TagReadDTO, row)
+        tag_type_cache.put(tag_type, tag)
+        return tag
+    return None
+
+@db_op("CREATE", "tags", "tag",
+       fields=lambda dto: {"type": dto.type},
+       describe=lambda tag: {"tag_id": tag.id, "type": tag.type})
+async def create_tag(db: AsyncSession, tag_dto: TagCreateDTO) -> TagReadDTO:
+    """
+    Cria uma nova tag no banco de dados; retorna None se o tipo já existir
+    """
+    tag = await _insert_unique(db, Tag, {"type": tag_dto.type}, TagReadDTO)
+    if tag is None:
+        return None
+    await db.flush()
+    _session_cache_clear(db, "tag_by_type")
+    return tag
+
+async def update_tag(db: AsyncSession, tag_id: str, tag_dto: TagCreateDTO) -> TagReadDTO:
+    """
+    Atualiza uma tag existente
+    """
+    return await tag_async_crud.update(db, tag_id, {"type": tag_dto.type})
+
+team_async_crud = AsyncCrud(team_crud)
+get_team_by_id = team_async_crud.get_by_id
+delete_team = team_async_crud.delete
+
+@db_op("CREATE", "teams", "time",
+       fields=lambda dto: {"name": dto.name, "competition": dto.competition},
+       describe=lambda team: {"team_id": team.id, "name": team.name, "competition": team.competition})
+async def create_team(db: AsyncSession, team_dto: TeamCreateDTO) -> TeamReadDTO:
+    """
+    Cria um novo time no banco de dados
+    """
+    team = await _insert_returning(db, Team, team_dto.model_dump(), TeamReadDTO)
+    await db.flush()
+    return team
+
+async def update_team(db: AsyncSession, team_id: str, team_dto: TeamCreateDTO) -> TeamReadDTO:
+    """
+    Atualiza um time existente
+    """
+    return await team_async_crud.update(db, team_id, team_dto.model_dump())
+
+container_async_crud = AsyncCrud(container_crud)
+get_container_by_id = container_async_crud.get_by_id
+delete_container = container_async_crud.delete
+
+@db_op("CREATE", "containers", "container",
+       fields=lambda dto: {"deadline": dto.deadline},
+       describe=lambda container: {"container_id": container.id,
+                                   "deadline": container.deadline.isoformat()})
+async def create_container(db: AsyncSession, container_dto: ContainerCreateDTO) -> ContainerReadDTO:
+    """
+    Cria um novo container no banco de dados
+    """
+    deadline = datetime.fromisoformat(container_dto.deadline)
+    container = await _insert_returning(db, Container, {"deadline": deadline}, ContainerReadDTO)
+    await db.flush()
+    return container
+
+async def update_container(db: AsyncSession, container_id: str, container_dto: ContainerCreateDTO) -> ContainerReadDTO:
+    """
+    Atualiza um container existente
+    """
+    deadline = datetime.fromisoformat(container_dto.deadline)
+    return await container_async_crud.update(db, container_id, {"deadline": deadline})
+
+async def _insert_ignore_duplicates(db: AsyncSession, model, rows: List[dict]) -> int:
+    """
+    INSERT em lote que descarta só as duplicatas da chave única (ver dbutils_mysql._insert_ignore_duplicates)
+    """
+    if not rows:
+        return 0
+    rows = [{"id": new_uuid(), **row} for row in rows]
+    stmt = _ASSOC_UPSERT[model][db.get_bind().dialect.name]
+    for chunk in _chunks(rows):
+        await db.execute(stmt, chunk)
+    result = await db.execute(_ASSOC_COUNT_BY_IDS[model], {"ids": [row["id"] for row in rows]})
+    return result.scalar()
+
+async def create_relationship(db: AsyncSession, model, label: str, relationship_dto: BaseModel) -> BaseModel:
+    """
+    Cria um relacionamento em uma tabela de associação; None quando ele já existe
+    """
+    keys = relationship_dto.model_dump()
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando criação de relacionamento %s", label, **keys)
+    
+    try:
+        try:
+            await db.execute(_ASSOC_INSERT[model], keys)
+        except IntegrityError as e:
+            if not is_duplicate_key(e):
+                raise e
+            db_logger.warning("Relacionamento %s já existe", label, **keys)
+            return None
+        await db.flush()
+        
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database_batched("CREATE", model.__tablename__, duration_ns, **keys)
+        
+        return relationship_dto
+    
+    except Exception as e:
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao criar relacionamento %s", label, 
+                       error=str(e),
+                       duration_ms=ns_to_ms(duration_ns),
+                       **keys)
+        raise e
+
+async def create_relationships_bulk(db: AsyncSession, model, label: str, relationship_dtos: List[BaseModel]) -> int:
+    """
+    Cria vários relacionamentos em uma tabela de associação; retorna a quantidade inserida
+    """
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando criação em lote de relacionamentos %s", label, 
+                   total=len(relationship_dtos))
+    
+    try:
+        inserted = await _insert_ignore_duplicates(db, model, [dto.model_dump() for dto in relationship_dtos])
+        await db.flush()
+        
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database("CREATE", model.__tablename__, duration_ns, 
+                              total=len(relationship_dtos),
+                              inserted=inserted)
+        
+        return inserted
+    
+    except Exception as e:
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao criar relacionamentos %s em lote", label, 
+                       error=str(e),
+                       total=len(relationship_dtos),
+                       duration_ms=ns_to_ms(duration_ns))
+        raise e
+
+async def delete_relationship(db: AsyncSession, model, label: str, **keys) -> bool:
+    """
+    Deleta um relacionamento de uma tabela de associação pelas suas chaves
+    """
+    start_ns = time.perf_counter_ns()
+    db_logger.info("Iniciando deleção de relacionamento %s", label, **keys)
+    
+    try:
+        #DELETE direto; rowcount indica se o relacionamento existia
+        result = await db.execute(_ASSOC_DELETE[model], keys)
+        if not result.rowcount:
+            db_logger.warning("Relacionamento %s não encontrado", label, **keys)
+            return False
+        
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.log_database_batched("DELETE", model.__tablename__, duration_ns, **keys)
+        
+        return True
+    
+    except Exception as e:
+        duration_ns = time.perf_counter_ns() - start_ns
+        db_logger.error("Erro ao deletar relacionamento %s", label, 
+                       error=str(e),
+                       duration_ms=ns_to_ms(duration_ns),
+                       **keys)
+        raise e
+
+async def create_user_competition(db: AsyncSession, user_competition_dto: UserCompetitionCreateDTO) -> UserCompetitionCreateDTO:
+    """
+    Cria um relacionamento usuário-competição
+    """
+    return await create_relationship(db, UserCompetition, "usuário-competição", user_competition_dto)
+
+async def create_user_competitions_bulk(db: AsyncSession, user_competition_dtos: List[UserCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos usuário-competição em um único INSERT
+    """
+    return await create_relationships_bulk(db, UserCompetition, "usuário-competição", user_competition_dtos)
+
+async def delete_user_competition(db: AsyncSession, user_id: str, competition_id: str) -> bool:
+    """
+    Deleta um relacionamento usuário-competição
+    """
+    return await delete_relationship(db, UserCompetition, "usuário-competição", user_id=user_id, competition_id=competition_id)
+
+async def create_user_team(db: AsyncSession, user_team_dto: UserTeamCreateDTO) -> UserTeamCreateDTO:
+    """
+    Cria um relacionamento usuário-time
+    """
+    return await create_relationship(db, UserTeam, "usuário-time", user_team_dto)
+
+async def create_user_teams_bulk(db: AsyncSession, user_team_dtos: List[UserTeamCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos usuário-time em um único INSERT
+    """
+    return await create_relationships_bulk(db, UserTeam, "usuário-time", user_team_dtos)
+
+async def delete_user_team(db: AsyncSession, user_id: str, team_id: str) -> bool:
+    """
+    Deleta um relacionamento usuário-time
+    """
+    return await delete_relationship(db, UserTeam, "usuário-time", user_id=user_id, team_id=team_id)
+
+async def create_team_competition(db: AsyncSession, team_competition_dto: TeamCompetitionCreateDTO) -> TeamCompetitionCreateDTO:
+    """
+    Cria um relacionamento time-competição
+    """
+    return await create_relationship(db, TeamCompetition, "time-competição", team_competition_dto)
+
+async def create_team_competitions_bulk(db: AsyncSession, team_competition_dtos: List[TeamCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos time-competição em um único INSERT
+    """
+    return await create_relationships_bulk(db, TeamCompetition, "time-competição", team_competition_dtos)
+
+async def delete_team_competition(db: AsyncSession, team_id: str, competition_id: str) -> bool:
+    """
+    Deleta um relacionamento time-competição
+    """
+    return await delete_relationship(db, TeamCompetition, "time-competição", team_id=team_id, competition_id=competition_id)
+
+async def create_exercise_tag(db: AsyncSession, exercise_tag_dto: ExerciseTagCreateDTO) -> ExerciseTagCreateDTO:
+    """
+    Cria um relacionamento exercício-tag
+    """
+    return await create_relationship(db, ExerciseTag, "exercício-tag", exercise_tag_dto)
+
+async def create_exercise_tags_bulk(db: AsyncSession, exercise_tag_dtos: List[ExerciseTagCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos exercício-tag em um único INSERT
+    """
+    return await create_relationships_bulk(db, ExerciseTag, "exercício-tag", exercise_tag_dtos)
+
+async def delete_exercise_tag(db: AsyncSession, exercise_id: str, tag_id: str) -> bool:
+    """
+    Deleta um relacionamento exercício-tag
+    """
+    return await delete_relationship(db, ExerciseTag, "exercício-tag", exercise_id=exercise_id, tag_id=tag_id)
+
+async def create_exercise_competition(db: AsyncSession, exercise_competition_dto: ExerciseCompetitionCreateDTO) -> ExerciseCompetitionCreateDTO:
+    """
+    Cria um relacionamento exercício-competição
+    """
+    return await create_relationship(db, ExerciseCompetition, "exercício-competição", exercise_competition_dto)
+
+async def create_exercise_competitions_bulk(db: AsyncSession, exercise_competition_dtos: List[ExerciseCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos exercício-competição em um único INSERT
+    """
+    return await create_relationships_bulk(db, ExerciseCompetition, "exercício-competição", exercise_competition_dtos)
+
+async def delete_exercise_competition(db: AsyncSession, exercise_id: str, competition_id: str) -> bool:
+    """
+    Deleta um relacionamento exercício-competição
+    """
+    return await delete_relationship(db, ExerciseCompetition, "exercício-competição", exercise_id=exercise_id, competition_id=competition_id)
+
+async def create_container_competition(db: AsyncSession, container_competition_dto: ContainerCompetitionCreateDTO) -> ContainerCompetitionCreateDTO:
+    """
+    Cria um relacionamento container-competição
+    """
+    return await create_relationship(db, ContainerCompetition, "container-competição", container_competition_dto)
+
+async def create_container_competitions_bulk(db: AsyncSession, container_competition_dtos: List[ContainerCompetitionCreateDTO]) -> int:
+    """
+    Cria vários relacionamentos container-competição em um único INSERT
+    """
+    return await create_relationships_bulk(db, ContainerCompetition, "container-competição", container_competition_dtos)
+
+async def delete_container_competition(db: AsyncSession, container_id: str, competition_id: str) -> bool:
+    """
+    Deleta um relacionamento container-competição
+    """
+    return await delete_relationship(db, ContainerCompetition, "container-competição", container_id=container_id, competition_id=competition_id)
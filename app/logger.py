@@ -1,10 +1,17 @@
 """
 Sistema de logging personalizado para o Dashboard
 """
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
 import re
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
 
@@ -36,151 +43,210 @@ class BracketLevelFormatter(logging.Formatter):
     
     # Cor para links (verde)
     LINK_COLOR = "\033[32m"
+    
+    # Regex para encontrar URLs (compilada uma única vez)
+    _URL_RE = re.compile(r'https?://[^\s]+')
+    _LINK_TEMPLATE = LINK_COLOR + r"\g<0>" + COLOR_RESET
 
     def __init__(self, fmt=None, datefmt=None, use_color=True, pretty_json=True):
         super().__init__(fmt=fmt, datefmt=datefmt)
-        self.use_color = use_color
+        # Sem terminal (stderr redirecionado para arquivo/pipe) as cores só adicionam custo e ruído;
+        # NO_COLOR (https://no-color.org) desliga as cores mesmo em terminal
+        self._is_tty = sys.stderr.isatty()
+        self.use_color = use_color and self._is_tty and os.environ.get("NO_COLOR") is None
         self.pretty_json = pretty_json
+        self._level_tags = self._CACHED_TAGS if self.use_color else self._PLAIN_TAGS
+        # (segundo, timestamp formatado) do último registro - tupla trocada de uma vez, segura entre threads
+        self._time_cache = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        # Sem datefmt o formato padrão inclui milissegundos; não há o que reaproveitar
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if second == cached_second:
+            return cached_text
+        text = time.strftime(datefmt, self.converter(second))
+        self._time_cache = (second, text)
+        return text
 
     def format(self, record: logging.LogRecord) -> str:
-        level_tag = f"[{record.levelname}]"
-        if self.use_color:
-            color = self.COLORS.get(record.levelno)
-            if color:
-                level_tag = f"{color}{level_tag}{self.COLOR_RESET}"
-        
-        # Processar mensagem para colorir links e JSON
-        if self.use_color:
-            record.msg = self._colorize_links(str(record.msg))
-            record.msg = self._colorize_json(record.msg)
+        # Níveis customizados (fora de COLORS) caem na tag sem cor
+        level_tag = self._level_tags.get(record.levelno) or f"[{record.levelname}]"
         
         # Injeta campo customizado para uso no fmt
         setattr(record, "levelname_br", level_tag)
-        return super().format(record)
-    
-    def _colorize_links(self, message: str) -> str:
-        """Coloriza links (http/https) na mensagem"""
-        # Regex para encontrar URLs
-        url_pattern = r'https?://[^\s]+'
         
-        def replace_url(match):
-            url = match.group(0)
-            return f"{self.LINK_COLOR}{url}{self.COLOR_RESET}"
+        # Mensagem que é só um objeto JSON: formata uma cópia rasa com o JSON já colorido,
+        # sem alterar o record (outros handlers continuam recebendo a mensagem original)
+        if self.use_color and isinstance(record.msg, str) and record.msg.startswith('{'):
+            colored_json = self._colorize_json(record.getMessage())
+            if colored_json is not None:
+                record = copy.copy(record)
+                record.msg, record.args = colored_json, None
+        
+        output = super().format(record)
+        if self.use_color:
+            output = self._colorize_links(output)
+        return output
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
         
-        # Substituir URLs encontradas
-        colored_message = re.sub(url_pattern, replace_url, message)
-        return colored_message
+        # Contexto estruturado (extra={"ctx": ...} do StructuredLogger) é serializado só aqui
+        ctx = getattr(record, "ctx", None)
+        if ctx:
+            message += self._format_context(ctx)
+        return message
+    
+    def _format_context(self, ctx: Dict[str, Any]) -> str:
+        """Formata o contexto estruturado como JSON anexado à mensagem (colorido a partir do dict)"""
+        # Para dados simples, usa formatação compacta
+        if len(ctx) <= 3 and all(isinstance(v, (str, int, float, bool)) for v in ctx.values()):
+            if self.use_color:
+                return " " + self._render_colored(ctx, pretty=False)
+            return " " + json.dumps(ctx, ensure_ascii=False)
+        if self.use_color:
+            return "\n" + self._render_colored(ctx, pretty=True)
+        return "\n" + json.dumps(ctx, indent=2, ensure_ascii=False)
     
-    def _colorize_json(self, message: str) -> str:
-        """Coloriza JSON na mensagem com cores específicas"""
-        if not self.use_color:
+    def _colorize_links(self, message: str) -> str:
+        """Coloriza links (http/https) na mensagem"""
+        # Caminho rápido: a maioria das linhas não tem URL e a busca por substring é bem mais barata que a regex
+        if "http" not in message:
             return message
-            
+        # Template fixo (\g<0> = URL encontrada): a substituição roda no motor de regex, sem callback Python
+        return self._URL_RE.sub(self._LINK_TEMPLATE, message)
+    
+    def _colorize_json(self, message: str) -> Optional[str]:
+        """Coloriza a mensagem se ela for um objeto JSON; retorna None caso contrário"""
+        stripped = message.strip()
+        if not stripped.endswith('}'):
+            return None
         try:
-            # Tenta detectar se a mensagem contém JSON
-            if not any(char in message for char in ['{', '}', '[', ']']):
-                return message
-            
-            # Verifica se a mensagem inteira é JSON válido
-            if message.strip().startswith('{') and message.strip().endswith('}'):
-                try:
-                    json_data = json.loads(message.strip())
-                    if self.pretty_json:
-                        formatted_json = json.dumps(json_data, indent=2, ensure_ascii=False)
-                    else:
-                        formatted_json = json.dumps(json_data, ensure_ascii=False)
-                    return self._apply_json_colors(formatted_json)
-                except json.JSONDecodeError:
-                    return message
-            
-            # Verifica se há JSON no final da mensagem (após quebra de linha)
-            lines = message.split('\n')
-            if len(lines) > 1 and lines[-1].strip().startswith('{'):
-                try:
-                    json_data = json.loads(lines[-1].strip())
-                    if self.pretty_json:
-                        formatted_json = json.dumps(json_data, indent=2, ensure_ascii=False)
-                    else:
-                        formatted_json = json.dumps(json_data, ensure_ascii=False)
-                    lines[-1] = self._apply_json_colors(formatted_json)
-                    return '\n'.join(lines)
-                except json.JSONDecodeError:
-                    pass
-            
-            # Se não for JSON válido, retorna a mensagem original
-            return message
-            
-        except Exception:
-            # Se houver qualquer erro, retorna a mensagem original
-            return message
+            json_data = json.loads(stripped)
+        except json.JSONDecodeError:
+            return None
+        return self._render_colored(json_data, pretty=self.pretty_json)
     
-    def _apply_json_colors(self, json_str: str) -> str:
-        """Aplica cores específicas a elementos JSON"""
-        if not self.use_color:
-            return json_str
+    def _render_colored(self, obj: Any, pretty: bool, indent: int = 0) -> str:
+        """
+        Serializa o objeto JSON já colorido, percorrendo a estrutura uma única vez
+        (mesmo layout de json.dumps com indent=2 quando pretty é verdadeiro)
+        """
+        reset = self.COLOR_RESET
+        colors = self.JSON_COLORS
         
-        try:
-            # Primeiro, colorir colchetes e chaves
-            json_str = re.sub(
-                r'([\{\}\[\]])',
-                rf'{self.JSON_COLORS["bracket"]}\1{self.COLOR_RESET}',
-                json_str
-            )
-            
-            # Colorir chaves (strings antes de :)
-            json_str = re.sub(
-                r'"([^"]+)"\s*:',
-                rf'{self.JSON_COLORS["key"]}"\1"{self.COLOR_RESET}:',
-                json_str
-            )
+        if isinstance(obj, (dict, list, tuple)):
+            is_dict = isinstance(obj, dict)
+            open_br, close_br = ('{', '}') if is_dict else ('[', ']')
+            bracket_open = f"{colors['bracket']}{open_br}{reset}"
+            bracket_close = f"{colors['bracket']}{close_br}{reset}"
+            if not obj:
+                return f"{bracket_open}{bracket_close}"
             
-            # Colorir strings (valores entre aspas) - mais específico
-            json_str = re.sub(
-                r':\s*"([^"]*)"',
-                rf': {self.JSON_COLORS["string"]}"\1"{self.COLOR_RESET}',
-                json_str
-            )
-            
-            # Colorir números (mais específico para evitar conflitos)
-            json_str = re.sub(
-                r':\s*(\d+\.?\d*)(?=\s*[,}\]]|$)',
-                rf': {self.JSON_COLORS["number"]}\1{self.COLOR_RESET}',
-                json_str
-            )
-            
-            # Colorir booleanos
-            json_str = re.sub(
-                r':\s*(true|false)(?=\s*[,}\]]|$)',
-                rf': {self.JSON_COLORS["boolean"]}\1{self.COLOR_RESET}',
-                json_str
-            )
-            
-            # Colorir null
-            json_str = re.sub(
-                r':\s*(null)(?=\s*[,}\]]|$)',
-                rf': {self.JSON_COLORS["null"]}\1{self.COLOR_RESET}',
-                json_str
-            )
+            if is_dict:
+                items = [
+                    f"{colors['key']}{json.dumps(str(k), ensure_ascii=False)}{reset}: "
+                    f"{self._render_colored(v, pretty, indent + 1)}"
+                    for k, v in obj.items()
+                ]
+            else:
+                items = [self._render_colored(v, pretty, indent + 1) for v in obj]
             
-        except Exception:
-            # Se houver erro, retorna o JSON sem cores
-            return json_str
+            if pretty:
+                inner_pad = "\n" + "  " * (indent + 1)
+                outer_pad = "\n" + "  " * indent
+                return f"{bracket_open}{inner_pad}{(',' + inner_pad).join(items)}{outer_pad}{bracket_close}"
+            return f"{bracket_open}{', '.join(items)}{bracket_close}"
         
-        return json_str
+        if obj is None:
+            return f"{colors['null']}null{reset}"
+        if isinstance(obj, bool):
+            return f"{colors['boolean']}{'true' if obj else 'false'}{reset}"
+        if isinstance(obj, (int, float)):
+            return f"{colors['number']}{json.dumps(obj)}{reset}"
+        return f"{colors['string']}{json.dumps(obj, ensure_ascii=False)}{reset}"
+
+# Tags "[LEVEL]" dos níveis padrão, montadas uma única vez no import (coloridas e sem cor)
+BracketLevelFormatter._CACHED_TAGS = {
+    level: f"{color}[{logging.getLevelName(level)}]{BracketLevelFormatter.COLOR_RESET}"
+    for level, color in BracketLevelFormatter.COLORS.items()
+}
+BracketLevelFormatter._PLAIN_TAGS = {
+    level: f"[{logging.getLevelName(level)}]" for level in BracketLevelFormatter.COLORS
+}
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler que não faz flush a cada registro: as linhas acumulam no buffer
+    do stream e uma thread faz flush a cada flush_interval segundos (e no close)
+    """
+
+    def __init__(self, stream=None, flush_interval: float = 0.05):
+        super().__init__(stream)
+        self._stop_flush = threading.Event()
+        self._flush_interval = flush_interval
+        self._flusher = threading.Thread(target=self._flush_loop, name="log-flush", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self):
+        while not self._stop_flush.wait(self._flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop_flush.set()
+        self.flush()
+        super().close()
+
+# Listener que drena a fila de logs em uma thread dedicada (ver setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
+def _stop_queue_listener():
+    """Para o listener atual, escrevendo os registros que ainda estão na fila."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        # Logs emitidos depois disso vão direto para o handler, em vez de ficarem presos na fila
+        root = logging.getLogger()
+        for h in list(root.handlers):
+            if isinstance(h, QueueHandler) and h.queue is _queue_listener.queue:
+                root.removeHandler(h)
+                for target in _queue_listener.handlers:
+                    root.addHandler(target)
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
 
 def setup_logging(level: int = logging.INFO, use_color: bool = True, pretty_json: bool = True) -> logging.Logger:
     """Configura logging global com formatter padronizado e cores."""
+    global _queue_listener
     root = logging.getLogger()
 
     # Evita handlers duplicados em hot-reload
     if root.handlers:
         for h in list(root.handlers):
             root.removeHandler(h)
+    previous_handlers = _queue_listener.handlers if _queue_listener is not None else ()
+    _stop_queue_listener()
+    for h in previous_handlers:
+        h.close()
 
     # Configura primeiro os loggers de terceiros para evitar conflitos
     _configure_third_party_loggers()
 
-    handler = logging.StreamHandler()
+    # stderr com buffer de 8 KiB (sem fechar o fd original): várias linhas por write()
+    stream = open(sys.stderr.fileno(), "w", buffering=8192, encoding="utf-8", closefd=False)
+    handler = BufferedStreamHandler(stream)
     formatter = BracketLevelFormatter(
         fmt="%(levelname_br)s | %(asctime)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -190,8 +256,14 @@ def setup_logging(level: int = logging.INFO, use_color: bool = True, pretty_json
     handler.setFormatter(formatter)
     handler.setLevel(level)
 
+    # Quem loga apenas enfileira o registro; formatação (cores/JSON) e escrita
+    # no stream acontecem na thread do QueueListener, fora do caminho da requisição
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
     root.setLevel(level)
-    root.addHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
 
     # Configuração específica para uvicorn
     _setup_uvicorn_logging(use_color)
@@ -265,12 +337,88 @@ def get_logger(name: str) -> logging.Logger:
     """Retorna um logger configurado para o módulo especificado."""
     return logging.getLogger(name)
 
+def ns_to_ms(duration_ns: int) -> float:
+    """Converte uma duração em nanossegundos (time.perf_counter_ns) para milissegundos."""
+    return round(duration_ns / 1_000_000, 2)
+
+class BatchedDBLogger:
+    """
+    Agrega tempos de operações de banco e emite um único registro a cada
+    batch_size operações ou flush_interval_ms (verificado a cada nova operação)
+    """
+    
+    def __init__(self, logger: "StructuredLogger", batch_size: int = 100, flush_interval_ms: int = 1000):
+        self._logger = logger
+        self.batch_size = batch_size
+        self.flush_interval_ns = flush_interval_ms * 1_000_000
+        self._lock = threading.Lock()
+        self._reset()
+    
+    def _reset(self):
+        self._count = 0
+        self._total_ns = 0
+        self._per_table: Dict[str, list] = {}
+        self._started_ns = time.perf_counter_ns()
+    
+    def _drain(self):
+        snapshot = (self._count, self._total_ns, self._per_table)
+        self._reset()
+        return snapshot
+    
+    def add(self, operation: str, table: str, duration_ns: int):
+        """Registra uma operação; emite o lote quando atingir o tamanho ou o intervalo."""
+        with self._lock:
+            self._count += 1
+            self._total_ns += duration_ns
+            stats = self._per_table.setdefault(f"{operation} {table}", [0, 0])
+            stats[0] += 1
+            stats[1] += duration_ns
+            if (self._count < self.batch_size
+                    and time.perf_counter_ns() - self._started_ns < self.flush_interval_ns):
+                return
+            snapshot = self._drain()
+        self._emit(*snapshot)
+    
+    def flush(self):
+        """Emite imediatamente as operações pendentes."""
+        with self._lock:
+            if not self._count:
+                return
+            snapshot = self._drain()
+        self._emit(*snapshot)
+    
+    def _emit(self, count: int, total_ns: int, per_table: Dict[str, list]):
+        self._logger.info(
+            "DB batch: %d ops, total %sms", count, ns_to_ms(total_ns),
+            per_table={
+                key: {"ops": ops, "duration_ms": ns_to_ms(ns)}
+                for key, (ops, ns) in per_table.items()
+            }
+        )
+
+# Lotes pendentes são emitidos na saída (antes do listener da fila parar: atexit é LIFO)
+_db_batches = []
+
+def _flush_db_batches():
+    for batch in _db_batches:
+        batch.flush()
+
+atexit.register(_flush_db_batches)
+
+def shutdown_logging():
+    """Emite os lotes pendentes e para o QueueListener (chamado no shutdown da aplicação)."""
+    _flush_db_batches()
+    _stop_queue_listener()
+
 class StructuredLogger:
     """Logger estruturado para diferentes contextos de aplicação."""
     
+    __slots__ = ("logger", "context", "_db_batch")
+    
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.context = {}
+        self._db_batch: Optional[BatchedDBLogger] = None
     
     def set_context(self, **kwargs):
         """Define contexto adicional para os logs."""
@@ -280,63 +428,67 @@ class StructuredLogger:
         """Limpa o contexto atual."""
         self.context.clear()
     
-    def _format_message(self, message: str, extra_data: Optional[Dict[str, Any]] = None) -> str:
-        """Formata mensagem com contexto e dados extras."""
-        if not self.context and not extra_data:
-            return message
-        
-        # Combina contexto e dados extras
-        all_data = {**self.context}
-        if extra_data:
-            all_data.update(extra_data)
-        
-        # Formata como JSON se houver dados
-        if all_data:
-            # Para dados simples, usa formatação compacta
-            if len(all_data) <= 3 and all(isinstance(v, (str, int, float, bool)) for v in all_data.values()):
-                json_data = json.dumps(all_data, ensure_ascii=False)
-                return f"{message} {json_data}"
-            else:
-                json_data = json.dumps(all_data, indent=2, ensure_ascii=False)
-                return f"{message}\n{json_data}"
-        
-        return message
+    def isEnabledFor(self, level: int) -> bool:
+        """Indica se o nível está habilitado (evita montar kwargs de logs descartados)."""
+        return self.logger.isEnabledFor(level)
     
-    def debug(self, message: str, **kwargs):
+    def _extra(self, extra_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Monta o extra= do LogRecord com contexto e dados extras; a serialização em JSON
+        fica para o formatter, que só recebe registros que passaram pelos filtros de nível
+        """
+        if not self.context:
+            # Caso comum (sem contexto): os kwargs da chamada já são um dict novo, sem cópia
+            return {"ctx": extra_data} if extra_data else None
+        # O contexto é copiado porque o registro só é formatado depois, na thread do QueueListener
+        if not extra_data:
+            return {"ctx": dict(self.context)}
+        return {"ctx": {**self.context, **extra_data}}
+    
+    def debug(self, message: str, *args, **kwargs):
         """Log de debug com contexto."""
-        formatted_msg = self._format_message(message, kwargs)
-        self.logger.debug(formatted_msg)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(message, *args, extra=self._extra(kwargs))
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log de info com contexto."""
-        formatted_msg = self._format_message(message, kwargs)
-        self.logger.info(formatted_msg)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(message, *args, extra=self._extra(kwargs))
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log de warning com contexto."""
-        formatted_msg = self._format_message(message, kwargs)
-        self.logger.warning(formatted_msg)
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self.logger.warning(message, *args, extra=self._extra(kwargs))
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log de error com contexto."""
-        formatted_msg = self._format_message(message, kwargs)
-        self.logger.error(formatted_msg)
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self.logger.error(message, *args, extra=self._extra(kwargs))
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log crítico com contexto."""
-        formatted_msg = self._format_message(message, kwargs)
-        self.logger.critical(formatted_msg)
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        self.logger.critical(message, *args, extra=self._extra(kwargs))
     
     def log_json(self, message: str, data: Union[Dict, list], level: int = logging.INFO):
         """Log específico para dados JSON."""
+        if not self.logger.isEnabledFor(level):
+            return
         json_str = json.dumps(data, indent=2, ensure_ascii=False)
         formatted_msg = f"{message}\n{json_str}"
         self.logger.log(level, formatted_msg)
     
     def log_request(self, method: str, url: str, status_code: int, response_time: float, **kwargs):
         """Log específico para requisições HTTP."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.info(
-            f"HTTP {method} {url} - {status_code}",
+            "HTTP %s %s - %s", method, url, status_code,
             method=method,
             url=url,
             status_code=status_code,
@@ -344,25 +496,50 @@ class StructuredLogger:
             **kwargs
         )
     
-    def log_database(self, operation: str, table: str, duration: float, **kwargs):
-        """Log específico para operações de banco de dados."""
+    def log_database(self, operation: str, table: str, duration_ns: int, **kwargs):
+        """Log específico para operações de banco de dados (duração em ns, de time.perf_counter_ns)."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.info(
-            f"DB {operation} on {table}",
+            "DB %s on %s", operation, table,
             operation=operation,
             table=table,
-            duration_ms=round(duration * 1000, 2),
+            duration_ms=ns_to_ms(duration_ns),
             **kwargs
         )
     
-    def log_api_response(self, endpoint: str, status_code: int, data: Any, **kwargs):
-        """Log específico para respostas de API."""
+    def log_database_batched(self, operation: str, table: str, duration_ns: int, **kwargs):
+        """
+        Versão agregada de log_database para caminhos de alto volume: apenas operação,
+        tabela e duração entram no lote (kwargs são descartados)
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if self._db_batch is None:
+            self._db_batch = BatchedDBLogger(self)
+            _db_batches.append(self._db_batch)
+        self._db_batch.add(operation, table, duration_ns)
+    
+    def log_api_response(self, endpoint: str, status_code: int, data: Any,
+                         duration_ns: Optional[int] = None, **kwargs):
+        """
+        Log específico para respostas de API (duração opcional em ns, de time.perf_counter_ns).
+        data pode ser um modelo Pydantic: model_dump só roda se o corpo for de fato logado (DEBUG)
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if duration_ns is not None:
+            kwargs["duration_ms"] = ns_to_ms(duration_ns)
         self.info(
-            f"API Response: {endpoint} - {status_code}",
+            "API Response: %s - %s", endpoint, status_code,
             endpoint=endpoint,
             status_code=status_code,
             **kwargs
         )
-        self.log_json("Response data:", data, logging.DEBUG)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            if hasattr(data, "model_dump"):
+                data = data.model_dump(mode="json")
+            self.log_json("Response data:", data, logging.DEBUG)
 
 def get_structured_logger(name: str) -> StructuredLogger:
     """Retorna um logger estruturado para o módulo especificado."""
@@ -377,11 +554,13 @@ def log_json_response(logger: logging.Logger, message: str, data: Any, level: in
 def log_http_request(logger: logging.Logger, method: str, url: str, status_code: int, 
                     response_time: float = None, **extra_data):
     """Função utilitária para log de requisições HTTP."""
-    msg = f"HTTP {method} {url} - {status_code}"
+    msg = "HTTP %s %s - %s"
+    args = [method, url, status_code]
     if response_time:
-        msg += f" ({response_time:.3f}s)"
+        msg += " (%.3fs)"
+        args.append(response_time)
     
-    logger.info(msg, extra={
+    logger.info(msg, *args, extra={
         'method': method,
         'url': url,
         'status_code': status_code,
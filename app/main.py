@@ -1,13 +1,16 @@
 #main.py
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import SQLAlchemyError
 from routers import router
-from database import init_db
+from database import init_db, pool_stats, warmup_pool
 from logger import (
     configure_development_logging, 
     configure_production_logging, 
-    get_structured_logger
+    get_structured_logger,
+    shutdown_logging
 )
 
 # Configura logging baseado no ambiente
@@ -17,25 +20,66 @@ else:
     configure_development_logging()
 
 app_logger = get_structured_logger("main")
+#Contexto fixo do serviço, definido uma vez e anexado pelo formatter a cada registro emitido
+app_logger.set_context(service="lycosidae-interpreter")
 
-app = FastAPI()
+#Respostas serializadas com orjson (encoder nativo) em vez do json da stdlib
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(router)
+#Origens do CORS separadas por vírgula - Example: ALLOWED_ORIGINS=https://app.example.com,https://admin.example.com
+#As credenciais continuam habilitadas como antes; com "*" (padrão) o middleware ecoa qualquer Origin em requisições
+#com cookie, então em produção a lista explícita de origens é obrigatória para front-ends que enviam credenciais
+ALLOWED_ORIGINS = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origin.strip()]
+if "*" in ALLOWED_ORIGINS and os.getenv("ENVIRONMENT", "development") == "production":
+    app_logger.warning("ALLOWED_ORIGINS não definido: CORS com credenciais aceitando qualquer origem")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
     allow_credentials=True,
 )
 
+#Erros não tratados nas rotas viram 500 em um único lugar (as rotas só levantam os 400/404 de domínio)
+#A mensagem interna vai apenas para o log; o cliente recebe um detalhe genérico
+@app.exception_handler(SQLAlchemyError)
+async def database_exception_handler(request: Request, exc: SQLAlchemyError):
+    app_logger.error("Erro interno no banco de dados", 
+                    method=request.method,
+                    path=request.url.path,
+                    error=str(exc))
+    return ORJSONResponse(status_code=500, content={"detail": "Erro interno no banco de dados"})
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    app_logger.error("Erro interno não tratado", 
+                    method=request.method,
+                    path=request.url.path,
+                    error_type=type(exc).__name__,
+                    error=str(exc))
+    return ORJSONResponse(status_code=500, content={"detail": "Erro interno do servidor"})
+
 @app.on_event("startup")
-def on_startup():
-    app_logger.info("Iniciando aplicação", service="lycosidae-interpreter")
-    init_db()
-    app_logger.info("Aplicação iniciada com sucesso", service="lycosidae-interpreter")
+async def on_startup():
+    app_logger.info("Iniciando aplicação")
+    await init_db()
+    await warmup_pool()
+    app_logger.info("Aplicação iniciada com sucesso")
+
+@app.on_event("shutdown")
+def on_shutdown():
+    app_logger.info("Encerrando aplicação")
+    #Escreve os registros que ainda estão na fila antes do processo terminar
+    shutdown_logging()
 
 @app.get("/")
 def read_root():
     response_data = {"message": "Microservice is up!", "service": "lycosidae-interpreter"}
     app_logger.log_api_response("/", 200, response_data)
     return response_data
+
+@app.get("/metrics")
+def read_metrics():
+    #Uso dos pools de conexão (sync e async) para acompanhar saturação sob carga
+    return {"service": "lycosidae-interpreter", "db_pool": pool_stats()}
@@ -1,29 +1,55 @@
 # models.py
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Date, Time, ForeignKey, CheckConstraint, UniqueConstraint, SmallInteger, Boolean
+    Column, Integer, String, DateTime, Date, Time, ForeignKey, CheckConstraint, UniqueConstraint, SmallInteger, Boolean, Index
 )
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.mysql import VARCHAR
+from sqlalchemy.orm import relationship, declarative_base, mapped_column
 import uuid
 
 Base = declarative_base()
 
+def new_uuid() -> str:
+    """
+    Default das chaves primárias (UUID4 em texto) - uma única função compartilhada por todas as tabelas
+    """
+    return str(uuid.uuid4())
+
+def uuid_pk():
+    """
+    Coluna de chave primária UUID usada por todos os modelos
+    """
+    return mapped_column(String(36), primary_key=True, default=new_uuid)
+
 class User(Base):
     __tablename__ = 'users'
-
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    username = Column(String(60), nullable=False, unique=True)
-    email = Column(String(45), nullable=False, unique=True)
-    password = Column(String(256), nullable=False)
+    __table_args__ = (
+        Index('ix_users_email', 'email', unique=True),
+        Index('ix_users_username', 'username', unique=True),
+    )
+
+    id = uuid_pk()
+    username = Column(String(60), nullable=False)
+    email = Column(String(45), nullable=False)
+    #Hash Argon2id (~97 chars) ou SHA-256 legado (64 hex) - ASCII puro, comparação binária sem conversão de charset
+    password = Column(
+        String(128).with_variant(VARCHAR(128, charset='ascii', collation='ascii_bin'), 'mysql', 'mariadb'),
+        nullable=False
+    )
     phone_number = Column(String(20), nullable=True)
     is_admin = Column(Boolean, default=False)
 
+    #Somente leitura - escritas continuam pelas tabelas de relacionamento
+    teams = relationship('Team', secondary='user_teams', viewonly=True)
+    competitions = relationship('Competition', secondary='user_competitions', viewonly=True)
+
 class Competition(Base):
     __tablename__ = 'competitions'
+    __table_args__ = (Index('ix_competitions_invite_code', 'invite_code', unique=True),)
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     name = Column(String(100), nullable=False)
     organizer = Column(String(100), nullable=False)
-    invite_code = Column(String(20), nullable=False, unique=True)
+    invite_code = Column(String(20), nullable=False)
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=False)
     max_teams = Column(Integer, default=20)
@@ -32,7 +58,7 @@ class Competition(Base):
 class Exercise(Base):
     __tablename__ = 'exercises'
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     link = Column(String(500), nullable=False)
     name = Column(String(100), nullable=False)
     score = Column(Integer, nullable=False)
@@ -40,65 +66,93 @@ class Exercise(Base):
     port = Column(Integer, nullable=False)
 class Tag(Base):
     __tablename__ = 'tags'
+    __table_args__ = (Index('ix_tags_type', 'type', unique=True),)
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    type = Column(String(50), nullable=False, unique=True)
+    id = uuid_pk()
+    type = Column(String(50), nullable=False)
 
 class Team(Base):
     __tablename__ = 'teams'
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     name = Column(String(100), nullable=False)
     competition = Column(String(36), ForeignKey('competitions.id'), nullable=False)
     creator = Column(String(36), ForeignKey('users.id'), nullable=False)
     score = Column(Integer, default=0)
     max_members = Column(Integer, default=20)
 
+    competitions = relationship('Competition', secondary='team_competitions', viewonly=True)
+
 class Container(Base):
     __tablename__ = 'containers'
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     deadline = Column(DateTime, nullable=False)
 
 # Relationship tables
+#A constraint única (a, b) já serve buscas por a (prefixo do índice); b ganha um índice próprio
 class UserCompetition(Base):
     __tablename__ = 'user_competitions'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'competition_id', name='uq_user_competition'),
+        Index('ix_user_competitions_competition_id', 'competition_id'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
     competition_id = Column(String(36), ForeignKey('competitions.id'), nullable=False)
 
 class UserTeam(Base):
     __tablename__ = 'user_teams'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'team_id', name='uq_user_team'),
+        Index('ix_user_teams_team_id', 'team_id'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     user_id = Column(String(36), ForeignKey('users.id'), nullable=False)
     team_id = Column(String(36), ForeignKey('teams.id'), nullable=False)
 
 class TeamCompetition(Base):
     __tablename__ = 'team_competitions'
+    __table_args__ = (
+        UniqueConstraint('team_id', 'competition_id', name='uq_team_competition'),
+        Index('ix_team_competitions_competition_id', 'competition_id'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     team_id = Column(String(36), ForeignKey('teams.id'), nullable=False)
     competition_id = Column(String(36), ForeignKey('competitions.id'), nullable=False)
 
 class ExerciseTag(Base):
     __tablename__ = 'exercise_tags'
+    __table_args__ = (
+        UniqueConstraint('exercise_id', 'tag_id', name='uq_exercise_tag'),
+        Index('ix_exercise_tags_tag_id', 'tag_id'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     exercise_id = Column(String(36), ForeignKey('exercises.id'), nullable=False)
     tag_id = Column(String(36), ForeignKey('tags.id'), nullable=False)
 
 class ExerciseCompetition(Base):
     __tablename__ = 'exercise_competitions'
+    __table_args__ = (
+        UniqueConstraint('exercise_id', 'competition_id', name='uq_exercise_competition'),
+        Index('ix_exercise_competitions_competition_id', 'competition_id'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     exercise_id = Column(String(36), ForeignKey('exercises.id'), nullable=False)
     competition_id = Column(String(36), ForeignKey('competitions.id'), nullable=False)
 
 class ContainerCompetition(Base):
     __tablename__ = 'container_competitions'
+    __table_args__ = (
+        UniqueConstraint('container_id', 'competition_id', name='uq_container_competition'),
+        Index('ix_container_competitions_competition_id', 'competition_id'),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = uuid_pk()
     container_id = Column(String(36), ForeignKey('containers.id'), nullable=False)
     competition_id = Column(String(36), ForeignKey('competitions.id'), nullable=False)
\ No newline at end of file
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, HTTPException, Request, Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import *
 from schemas import *
 from dbutils_mysql import *
-from database import get_db
+import dbutils_mysql_async as async_db
+from database import get_async_db
+from pydantic import conlist
 from typing import Optional
 from logger import get_structured_logger
 import time
@@ -26,6 +29,24 @@ def create_success_response(data, message="Operação realizada com sucesso", **
         **kwargs
     }
 
+def dto_response(dto, status_code=200):
+    """
+    Serializa o DTO de leitura direto para JSON (pydantic-core, uma passada)
+    Um Response pronto não passa pela revalidação do response_model, que continua valendo para a documentação
+    """
+    return Response(content=dto.model_dump_json(), media_type="application/json", status_code=status_code)
+
+async def bulk_response(create_bulk, db: AsyncSession, payload: list):
+    """
+    Executa uma criação em lote de relacionamentos e monta a resposta (inseridos e total recebido)
+    Só relacionamentos já existentes são ignorados; IDs inexistentes (FK) rejeitam o lote inteiro
+    """
+    try:
+        inserted = await create_bulk(db, payload)
+    except IntegrityError:
+        raise HTTPException(400, detail="Lote contém IDs inexistentes")
+    return {"inserted": inserted, "total": len(payload)}
+
 def create_error_response(message, error_code=None, details=None, **kwargs):
     """Cria uma resposta de erro padronizada"""
     return {
@@ -42,7 +63,7 @@ async def root_func():
     """
     Função padrão, altere conforme necessário
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     logger.info("Acessando função raiz", endpoint="/route")
     
     response_data = {
@@ -61,13 +82,13 @@ async def root_func():
         }
     }
     
-    response_time = time.time() - start_time
-    logger.log_api_response("/route", 200, response_data, response_time=response_time)
+    duration_ns = time.perf_counter_ns() - start_ns
+    logger.log_api_response("/route", 200, response_data, duration_ns=duration_ns)
     
     return response_data
     
 @router.post("/register", response_model=UserReadDTO, status_code=201)
-async def user_register(payload: UserCreateDTO, db: Session = Depends(get_db)):
+async def user_register(payload: UserCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Função para criação genérica de usuário baseada em um DTO JSON
     Input: UserCreateDTO
@@ -79,44 +100,49 @@ async def user_register(payload: UserCreateDTO, db: Session = Depends(get_db)):
                 username=payload.username,
                 endpoint="/route/register")
     
-    try:
-        existing_email = get_user_by_email(db, payload.email)
-        if existing_email:
-            logger.warning("Tentativa de registro com email já cadastrado", email=payload.email)
-            raise HTTPException(400, detail="E-mail já cadastrado")
-        
-        existing_username = get_user_by_username(db, payload.username)
-        if existing_username:
-            logger.warning("Tentativa de registro com username já cadastrado", username=payload.username)
-            raise HTTPException(400, detail="Username já cadastrado")
-        
+    #EXISTS barato antes do hash Argon2, para registros duplicados não pagarem o hash
+    conflict = await async_db.get_user_conflict(db, payload.email, payload.username)
+    user = None
+    if conflict is None:
         logger.info("Criando novo usuário", email=payload.email, username=payload.username)
-        user = create_user(db, payload)
-        
-        response_time = time.time() - start_time
-        logger.log_api_response("/route/register", 201, user.dict(), 
-                               response_time=response_time,
-                               user_id=user.id)
-        
-        return user
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro no registro de usuário", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno no registro de usuário", 
-                    error=str(e), 
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+        user = await async_db.create_user(db, payload)
+        if user is None:
+            #Outra requisição cadastrou o mesmo email/username entre a checagem e o INSERT
+            conflict = await async_db.get_user_conflict(db, payload.email, payload.username)
+    
+    if conflict == "email":
+        logger.warning("Tentativa de registro com email já cadastrado", email=payload.email)
+        raise HTTPException(400, detail="E-mail já cadastrado")
+    if conflict == "username":
+        logger.warning("Tentativa de registro com username já cadastrado", username=payload.username)
+        raise HTTPException(400, detail="Username já cadastrado")
+    if user is None:
+        #O registro conflitante foi removido antes da segunda checagem
+        logger.warning("Tentativa de registro com email ou username já cadastrado",
+                       email=payload.email, username=payload.username)
+        raise HTTPException(400, detail="E-mail ou username já cadastrado")
+    
+    response_time = time.time() - start_time
+    logger.log_api_response("/route/register", 201, user, 
+                           response_time=response_time,
+                           user_id=user.id)
+    
+    return user
+
 
+@router.get("/users/{user_id}/full", response_model=UserReadFullDTO)
+async def get_user_full_endpoint(user_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Busca um usuário pelo ID junto com seus times e competições
+    """
+    user = await async_db.get_user_by_id_full(db, user_id)
+    if not user:
+        raise HTTPException(404, detail="Usuário não encontrado")
+    
+    return dto_response(user)
 
 @router.post("/competitions", response_model=CompetitionReadDTO, status_code=201)
-async def create_competition_endpoint(payload: CompetitionCreateDTO, db: Session = Depends(get_db)):
+async def create_competition_endpoint(payload: CompetitionCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria uma nova competição
     """
@@ -127,41 +153,24 @@ async def create_competition_endpoint(payload: CompetitionCreateDTO, db: Session
                 invite_code=payload.invite_code,
                 endpoint="/route/competitions")
     
-    try:
-        existing_competition = get_competition_by_invite_code(db, payload.invite_code)
-        if existing_competition:
-            logger.warning("Tentativa de criar competição com código de convite já existente", 
-                          invite_code=payload.invite_code)
-            raise HTTPException(400, detail="Código de convite já existe")
-        
-        logger.info("Criando nova competição", 
-                   name=payload.name, 
-                   organizer=payload.organizer)
-        competition = create_competition(db, payload)
-        
-        response_time = time.time() - start_time
-        logger.log_api_response("/route/competitions", 201, competition.dict(), 
-                               response_time=response_time,
-                               competition_id=competition.id)
-        
-        return competition
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro na criação de competição", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno na criação de competição", 
-                    error=str(e), 
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    logger.info("Criando nova competição", 
+               name=payload.name, 
+               organizer=payload.organizer)
+    competition = await async_db.create_competition(db, payload)
+    if competition is None:
+        logger.warning("Tentativa de criar competição com código de convite já existente", 
+                      invite_code=payload.invite_code)
+        raise HTTPException(400, detail="Código de convite já existe")
+    
+    response_time = time.time() - start_time
+    logger.log_api_response("/route/competitions", 201, competition, 
+                           response_time=response_time,
+                           competition_id=competition.id)
+    
+    return competition
 
 @router.get("/competitions/{competition_id}", response_model=CompetitionReadDTO)
-async def get_competition_endpoint(competition_id: str, db: Session = Depends(get_db)):
+async def get_competition_endpoint(competition_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca uma competição pelo ID
     """
@@ -170,79 +179,47 @@ async def get_competition_endpoint(competition_id: str, db: Session = Depends(ge
                 competition_id=competition_id,
                 endpoint="/route/competitions/{competition_id}")
     
-    try:
-        competition = get_competition_by_id(db, competition_id)
-        if not competition:
-            logger.warning("Competição não encontrada", competition_id=competition_id)
-            raise HTTPException(404, detail="Competição não encontrada")
-        
-        response_time = time.time() - start_time
-        logger.log_api_response(f"/route/competitions/{competition_id}", 200, competition.dict(), 
-                               response_time=response_time,
-                               competition_id=competition.id)
-        
-        return competition
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro ao buscar competição", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    competition_id=competition_id,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno ao buscar competição", 
-                    error=str(e), 
-                    competition_id=competition_id,
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    competition = await async_db.get_competition_by_id(db, competition_id)
+    if not competition:
+        logger.warning("Competição não encontrada", competition_id=competition_id)
+        raise HTTPException(404, detail="Competição não encontrada")
+    
+    response_time = time.time() - start_time
+    logger.log_api_response(f"/route/competitions/{competition_id}", 200, competition, 
+                           response_time=response_time,
+                           competition_id=competition.id)
+    
+    return dto_response(competition)
 
 @router.get("/competitions/invite/{invite_code}", response_model=CompetitionReadDTO)
-async def get_competition_by_invite_endpoint(invite_code: str, db: Session = Depends(get_db)):
+async def get_competition_by_invite_endpoint(invite_code: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca uma competição pelo código de convite
     """
-    try:
-        competition = get_competition_by_invite_code(db, invite_code)
-        if not competition:
-            raise HTTPException(404, detail="Competição não encontrada")
-        
-        return competition
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    competition = await async_db.get_competition_by_invite_code(db, invite_code)
+    if not competition:
+        raise HTTPException(404, detail="Competição não encontrada")
+    
+    return dto_response(competition)
 
 @router.put("/competitions/{competition_id}")
-async def update_competition_endpoint(competition_id: str, payload: CompetitionCreateDTO, db: Session = Depends(get_db)):
+async def update_competition_endpoint(competition_id: str, payload: CompetitionCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Atualiza uma competição existente
     """
+    #Conflito de código de convite detectado pela chave única no próprio UPDATE
     try:
-        existing_competition = get_competition_by_id(db, competition_id)
-        if not existing_competition:
-            raise HTTPException(404, detail="Competição não encontrada")
-        
-        if payload.invite_code != existing_competition.invite_code:
-            conflict_competition = get_competition_by_invite_code(db, payload.invite_code)
-            if conflict_competition:
-                raise HTTPException(400, detail="Código de convite já existe")
-        
-        competition = update_competition(db, competition_id, payload)
-        if not competition:
-            raise HTTPException(404, detail="Competição não encontrada")
-        return competition.dict()
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        competition = await async_db.update_competition(db, competition_id, payload)
+    except IntegrityError as e:
+        if not is_duplicate_key(e):
+            raise e
+        raise HTTPException(400, detail="Código de convite já existe")
+    if not competition:
+        raise HTTPException(404, detail="Competição não encontrada")
+    return competition.model_dump(mode="json")
 
 @router.delete("/competitions/{competition_id}")
-async def delete_competition_endpoint(competition_id: str, db: Session = Depends(get_db)):
+async def delete_competition_endpoint(competition_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta uma competição
     """
@@ -251,44 +228,27 @@ async def delete_competition_endpoint(competition_id: str, db: Session = Depends
                 competition_id=competition_id,
                 endpoint="/route/competitions/{competition_id}")
     
-    try:
-        success = delete_competition(db, competition_id)
-        if not success:
-            logger.warning("Tentativa de deletar competição inexistente", competition_id=competition_id)
-            raise HTTPException(404, detail="Competição não encontrada")
-        
-        response_time = time.time() - start_time
-        response_data = create_success_response(
-            data={"competition_id": competition_id},
-            message="Competição deletada com sucesso",
-            operation="delete_competition"
-        )
-        
-        logger.log_api_response(f"/route/competitions/{competition_id}", 200, response_data, 
-                               response_time=response_time,
-                               competition_id=competition_id)
-        
-        return response_data
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro ao deletar competição", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    competition_id=competition_id,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno ao deletar competição", 
-                    error=str(e), 
-                    competition_id=competition_id,
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    success = await async_db.delete_competition(db, competition_id)
+    if not success:
+        logger.warning("Tentativa de deletar competição inexistente", competition_id=competition_id)
+        raise HTTPException(404, detail="Competição não encontrada")
+    
+    response_time = time.time() - start_time
+    response_data = create_success_response(
+        data={"competition_id": competition_id},
+        message="Competição deletada com sucesso",
+        operation="delete_competition"
+    )
+    
+    logger.log_api_response(f"/route/competitions/{competition_id}", 200, response_data, 
+                           response_time=response_time,
+                           competition_id=competition_id)
+    
+    return response_data
 
 
 @router.post("/exercises", response_model=ExerciseReadDTO, status_code=201)
-async def create_exercise_endpoint(payload: ExerciseCreateDTO, db: Session = Depends(get_db)):
+async def create_exercise_endpoint(payload: ExerciseCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um novo exercício
     """
@@ -299,59 +259,39 @@ async def create_exercise_endpoint(payload: ExerciseCreateDTO, db: Session = Dep
                 score=payload.score,
                 endpoint="/route/exercises")
     
-    try:
-        exercise = create_exercise(db, payload)
-        
-        response_time = time.time() - start_time
-        logger.log_api_response("/route/exercises", 201, exercise.dict(), 
-                               response_time=response_time,
-                               exercise_id=exercise.id)
-        
-        return exercise
-        
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno na criação de exercício", 
-                    error=str(e), 
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    exercise = await async_db.create_exercise(db, payload)
+    
+    response_time = time.time() - start_time
+    logger.log_api_response("/route/exercises", 201, exercise, 
+                           response_time=response_time,
+                           exercise_id=exercise.id)
+    
+    return exercise
 
 @router.get("/exercises/{exercise_id}", response_model=ExerciseReadDTO)
-async def get_exercise_endpoint(exercise_id: str, db: Session = Depends(get_db)):
+async def get_exercise_endpoint(exercise_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca um exercício pelo ID
     """
-    try:
-        exercise = get_exercise_by_id(db, exercise_id)
-        if not exercise:
-            raise HTTPException(404, detail="Exercício não encontrado")
-        
-        return exercise
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    exercise = await async_db.get_exercise_by_id(db, exercise_id)
+    if not exercise:
+        raise HTTPException(404, detail="Exercício não encontrado")
+    
+    return dto_response(exercise)
 
 @router.put("/exercises/{exercise_id}", response_model=ExerciseReadDTO)
-async def update_exercise_endpoint(exercise_id: str, payload: ExerciseCreateDTO, db: Session = Depends(get_db)):
+async def update_exercise_endpoint(exercise_id: str, payload: ExerciseCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Atualiza um exercício existente
     """
-    try:
-        exercise = update_exercise(db, exercise_id, payload)
-        if not exercise:
-            raise HTTPException(404, detail="Exercício não encontrado")
-        
-        return exercise
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    exercise = await async_db.update_exercise(db, exercise_id, payload)
+    if not exercise:
+        raise HTTPException(404, detail="Exercício não encontrado")
+    
+    return exercise
 
 @router.delete("/exercises/{exercise_id}")
-async def delete_exercise_endpoint(exercise_id: str, db: Session = Depends(get_db)):
+async def delete_exercise_endpoint(exercise_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um exercício
     """
@@ -360,282 +300,186 @@ async def delete_exercise_endpoint(exercise_id: str, db: Session = Depends(get_d
                 exercise_id=exercise_id,
                 endpoint="/route/exercises/{exercise_id}")
     
-    try:
-        success = delete_exercise(db, exercise_id)
-        if not success:
-            logger.warning("Tentativa de deletar exercício inexistente", exercise_id=exercise_id)
-            raise HTTPException(404, detail="Exercício não encontrado")
-        
-        response_time = time.time() - start_time
-        response_data = create_success_response(
-            data={"exercise_id": exercise_id},
-            message="Exercício deletado com sucesso",
-            operation="delete_exercise"
-        )
-        
-        logger.log_api_response(f"/route/exercises/{exercise_id}", 200, response_data, 
-                               response_time=response_time,
-                               exercise_id=exercise_id)
-        
-        return response_data
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro ao deletar exercício", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    exercise_id=exercise_id,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno ao deletar exercício", 
-                    error=str(e), 
-                    exercise_id=exercise_id,
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    success = await async_db.delete_exercise(db, exercise_id)
+    if not success:
+        logger.warning("Tentativa de deletar exercício inexistente", exercise_id=exercise_id)
+        raise HTTPException(404, detail="Exercício não encontrado")
+    
+    response_time = time.time() - start_time
+    response_data = create_success_response(
+        data={"exercise_id": exercise_id},
+        message="Exercício deletado com sucesso",
+        operation="delete_exercise"
+    )
+    
+    logger.log_api_response(f"/route/exercises/{exercise_id}", 200, response_data, 
+                           response_time=response_time,
+                           exercise_id=exercise_id)
+    
+    return response_data
 
 
 @router.post("/tags", response_model=TagReadDTO, status_code=201)
-async def create_tag_endpoint(payload: TagCreateDTO, db: Session = Depends(get_db)):
+async def create_tag_endpoint(payload: TagCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria uma nova tag
     """
-    try:
-        existing_tag = get_tag_by_type(db, payload.type)
-        if existing_tag:
-            raise HTTPException(400, detail="Tipo de tag já existe")
-        
-        tag = create_tag(db, payload)
-        return tag
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    tag = await async_db.create_tag(db, payload)
+    if tag is None:
+        raise HTTPException(400, detail="Tipo de tag já existe")
+    
+    return tag
 
 @router.get("/tags/{tag_id}", response_model=TagReadDTO)
-async def get_tag_endpoint(tag_id: str, db: Session = Depends(get_db)):
+async def get_tag_endpoint(tag_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca uma tag pelo ID
     """
-    try:
-        tag = get_tag_by_id(db, tag_id)
-        if not tag:
-            raise HTTPException(404, detail="Tag não encontrada")
-        
-        return tag
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    tag = await async_db.get_tag_by_id(db, tag_id)
+    if not tag:
+        raise HTTPException(404, detail="Tag não encontrada")
+    
+    return dto_response(tag)
 
 @router.get("/tags/type/{tag_type}", response_model=TagReadDTO)
-async def get_tag_by_type_endpoint(tag_type: str, db: Session = Depends(get_db)):
+async def get_tag_by_type_endpoint(tag_type: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca uma tag pelo tipo
     """
-    try:
-        tag = get_tag_by_type(db, tag_type)
-        if not tag:
-            raise HTTPException(404, detail="Tag não encontrada")
-        
-        return tag
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    tag = await async_db.get_tag_by_type(db, tag_type)
+    if not tag:
+        raise HTTPException(404, detail="Tag não encontrada")
+    
+    return dto_response(tag)
 
 @router.put("/tags/{tag_id}", response_model=TagReadDTO)
-async def update_tag_endpoint(tag_id: str, payload: TagCreateDTO, db: Session = Depends(get_db)):
+async def update_tag_endpoint(tag_id: str, payload: TagCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Atualiza uma tag existente
     """
+    #Conflito de tipo detectado pela chave única no próprio UPDATE
     try:
-        existing_tag = get_tag_by_id(db, tag_id)
-        if not existing_tag:
-            raise HTTPException(404, detail="Tag não encontrada")
-        
-        if payload.type != existing_tag.type:
-            conflict_tag = get_tag_by_type(db, payload.type)
-            if conflict_tag:
-                raise HTTPException(400, detail="Tipo de tag já existe")
-        
-        tag = update_tag(db, tag_id, payload)
-        return tag
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        tag = await async_db.update_tag(db, tag_id, payload)
+    except IntegrityError as e:
+        if not is_duplicate_key(e):
+            raise e
+        raise HTTPException(400, detail="Tipo de tag já existe")
+    if not tag:
+        raise HTTPException(404, detail="Tag não encontrada")
+    
+    return tag
 
 @router.delete("/tags/{tag_id}")
-async def delete_tag_endpoint(tag_id: str, db: Session = Depends(get_db)):
+async def delete_tag_endpoint(tag_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta uma tag
     """
-    try:
-        success = delete_tag(db, tag_id)
-        if not success:
-            raise HTTPException(404, detail="Tag não encontrada")
-        
-        return {"message": "Tag deletada com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_tag(db, tag_id)
+    if not success:
+        raise HTTPException(404, detail="Tag não encontrada")
+    
+    return {"message": "Tag deletada com sucesso"}
 
 
 @router.post("/teams", response_model=TeamReadDTO, status_code=201)
-async def create_team_endpoint(payload: TeamCreateDTO, db: Session = Depends(get_db)):
+async def create_team_endpoint(payload: TeamCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um novo time
     """
-    try:
-        competition = get_competition_by_id(db, payload.competition)
-        if not competition:
-            raise HTTPException(400, detail="Competição não encontrada")
-        
-        creator = get_user_by_id(db, payload.creator)
-        if not creator:
-            raise HTTPException(400, detail="Criador não encontrado")
-        
-        team = create_team(db, payload)
-        return team
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    competition_exists, creator_exists = await async_db.check_parents_exist(db, (Competition, payload.competition), (User, payload.creator))
+    if not competition_exists:
+        raise HTTPException(400, detail="Competição não encontrada")
+    
+    if not creator_exists:
+        raise HTTPException(400, detail="Criador não encontrado")
+    
+    team = await async_db.create_team(db, payload)
+    return team
 
 @router.get("/teams/{team_id}", response_model=TeamReadDTO)
-async def get_team_endpoint(team_id: str, db: Session = Depends(get_db)):
+async def get_team_endpoint(team_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca um time pelo ID
     """
-    try:
-        team = get_team_by_id(db, team_id)
-        if not team:
-            raise HTTPException(404, detail="Time não encontrado")
-        
-        return team
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    team = await async_db.get_team_by_id(db, team_id)
+    if not team:
+        raise HTTPException(404, detail="Time não encontrado")
+    
+    return dto_response(team)
 
 @router.put("/teams/{team_id}", response_model=TeamReadDTO)
-async def update_team_endpoint(team_id: str, payload: TeamCreateDTO, db: Session = Depends(get_db)):
+async def update_team_endpoint(team_id: str, payload: TeamCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Atualiza um time existente
     """
-    try:
-        competition = get_competition_by_id(db, payload.competition)
-        if not competition:
-            raise HTTPException(400, detail="Competição não encontrada")
-        
-        creator = get_user_by_id(db, payload.creator)
-        if not creator:
-            raise HTTPException(400, detail="Criador não encontrado")
-        
-        team = update_team(db, team_id, payload)
-        if not team:
-            raise HTTPException(404, detail="Time não encontrado")
-        
-        return team
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    competition_exists, creator_exists = await async_db.check_parents_exist(db, (Competition, payload.competition), (User, payload.creator))
+    if not competition_exists:
+        raise HTTPException(400, detail="Competição não encontrada")
+    
+    if not creator_exists:
+        raise HTTPException(400, detail="Criador não encontrado")
+    
+    team = await async_db.update_team(db, team_id, payload)
+    if not team:
+        raise HTTPException(404, detail="Time não encontrado")
+    
+    return team
 
 @router.delete("/teams/{team_id}")
-async def delete_team_endpoint(team_id: str, db: Session = Depends(get_db)):
+async def delete_team_endpoint(team_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um time
     """
-    try:
-        success = delete_team(db, team_id)
-        if not success:
-            raise HTTPException(404, detail="Time não encontrado")
-        
-        return {"message": "Time deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_team(db, team_id)
+    if not success:
+        raise HTTPException(404, detail="Time não encontrado")
+    
+    return {"message": "Time deletado com sucesso"}
 
 
 @router.post("/containers", status_code=201)
-async def create_container_endpoint(payload: ContainerCreateDTO, db: Session = Depends(get_db)):
+async def create_container_endpoint(payload: ContainerCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um novo container
     """
-    try:
-        container = create_container(db, payload)
-        return container.dict()
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    container = await async_db.create_container(db, payload)
+    return container.model_dump(mode="json")
 
 @router.get("/containers/{container_id}", response_model=ContainerReadDTO)
-async def get_container_endpoint(container_id: str, db: Session = Depends(get_db)):
+async def get_container_endpoint(container_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Busca um container pelo ID
     """
-    try:
-        container = get_container_by_id(db, container_id)
-        if not container:
-            raise HTTPException(404, detail="Container não encontrado")
-        
-        return container
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    container = await async_db.get_container_by_id(db, container_id)
+    if not container:
+        raise HTTPException(404, detail="Container não encontrado")
+    
+    return dto_response(container)
 
 @router.put("/containers/{container_id}", response_model=ContainerReadDTO)
-async def update_container_endpoint(container_id: str, payload: ContainerCreateDTO, db: Session = Depends(get_db)):
+async def update_container_endpoint(container_id: str, payload: ContainerCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Atualiza um container existente
     """
-    try:
-        container = update_container(db, container_id, payload)
-        if not container:
-            raise HTTPException(404, detail="Container não encontrado")
-        
-        return container
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    container = await async_db.update_container(db, container_id, payload)
+    if not container:
+        raise HTTPException(404, detail="Container não encontrado")
+    
+    return container
 
 @router.delete("/containers/{container_id}")
-async def delete_container_endpoint(container_id: str, db: Session = Depends(get_db)):
+async def delete_container_endpoint(container_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um container
     """
-    try:
-        success = delete_container(db, container_id)
-        if not success:
-            raise HTTPException(404, detail="Container não encontrado")
-        
-        return {"message": "Container deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_container(db, container_id)
+    if not success:
+        raise HTTPException(404, detail="Container não encontrado")
+    
+    return {"message": "Container deletado com sucesso"}
 
 @router.post("/user-competitions", response_model=UserCompetitionCreateDTO, status_code=201)
-async def create_user_competition_endpoint(payload: UserCompetitionCreateDTO, db: Session = Depends(get_db)):
+async def create_user_competition_endpoint(payload: UserCompetitionCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um relacionamento usuário-competição
     """
@@ -645,54 +489,43 @@ async def create_user_competition_endpoint(payload: UserCompetitionCreateDTO, db
                 competition_id=payload.competition_id,
                 endpoint="/route/user-competitions")
     
-    try:
-        user = get_user_by_id(db, payload.user_id)
-        if not user:
-            logger.warning("Tentativa de criar relacionamento com usuário inexistente", 
-                          user_id=payload.user_id)
-            raise HTTPException(400, detail="Usuário não encontrado")
-        
-        competition = get_competition_by_id(db, payload.competition_id)
-        if not competition:
-            logger.warning("Tentativa de criar relacionamento com competição inexistente", 
-                          competition_id=payload.competition_id)
-            raise HTTPException(400, detail="Competição não encontrada")
-        
-        user_competition = create_user_competition(db, payload)
-        if not user_competition:
-            logger.warning("Tentativa de criar relacionamento já existente", 
-                          user_id=payload.user_id,
-                          competition_id=payload.competition_id)
-            raise HTTPException(400, detail="Relacionamento já existe")
-        
-        response_time = time.time() - start_time
-        logger.log_api_response("/route/user-competitions", 201, user_competition.dict(), 
-                               response_time=response_time,
-                               user_id=payload.user_id,
-                               competition_id=payload.competition_id)
-        
-        return user_competition
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro na criação de relacionamento usuário-competição", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    user_id=payload.user_id,
-                    competition_id=payload.competition_id,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno na criação de relacionamento usuário-competição", 
-                    error=str(e), 
-                    user_id=payload.user_id,
-                    competition_id=payload.competition_id,
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    user_exists, competition_exists = await async_db.check_parents_exist(db, (User, payload.user_id), (Competition, payload.competition_id))
+    if not user_exists:
+        logger.warning("Tentativa de criar relacionamento com usuário inexistente", 
+                      user_id=payload.user_id)
+        raise HTTPException(400, detail="Usuário não encontrado")
+    
+    if not competition_exists:
+        logger.warning("Tentativa de criar relacionamento com competição inexistente", 
+                      competition_id=payload.competition_id)
+        raise HTTPException(400, detail="Competição não encontrada")
+    
+    user_competition = await async_db.create_user_competition(db, payload)
+    if not user_competition:
+        logger.warning("Tentativa de criar relacionamento já existente", 
+                      user_id=payload.user_id,
+                      competition_id=payload.competition_id)
+        raise HTTPException(400, detail="Relacionamento já existe")
+    
+    response_time = time.time() - start_time
+    logger.log_api_response("/route/user-competitions", 201, user_competition, 
+                           response_time=response_time,
+                           user_id=payload.user_id,
+                           competition_id=payload.competition_id)
+    
+    return user_competition
+
+@router.post("/user-competitions/bulk", status_code=201)
+async def create_user_competitions_bulk_endpoint(payload: conlist(UserCompetitionCreateDTO, max_length=BULK_MAX_ITEMS), db: AsyncSession = Depends(get_async_db)):
+    """
+    Cria vários relacionamentos usuário-competição em lote (até BULK_MAX_ITEMS por requisição)
+    Relacionamentos já existentes são ignorados; IDs inexistentes rejeitam o lote (400)
+    Output: quantidade inserida e total recebido
+    """
+    return await bulk_response(async_db.create_user_competitions_bulk, db, payload)
 
 @router.delete("/user-competitions/{user_id}/{competition_id}")
-async def delete_user_competition_endpoint(user_id: str, competition_id: str, db: Session = Depends(get_db)):
+async def delete_user_competition_endpoint(user_id: str, competition_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um relacionamento usuário-competição
     """
@@ -702,252 +535,213 @@ async def delete_user_competition_endpoint(user_id: str, competition_id: str, db
                 competition_id=competition_id,
                 endpoint="/route/user-competitions/{user_id}/{competition_id}")
     
-    try:
-        success = delete_user_competition(db, user_id, competition_id)
-        if not success:
-            logger.warning("Tentativa de deletar relacionamento inexistente", 
-                          user_id=user_id,
-                          competition_id=competition_id)
-            raise HTTPException(404, detail="Relacionamento não encontrado")
-        
-        response_time = time.time() - start_time
-        response_data = create_success_response(
-            data={"user_id": user_id, "competition_id": competition_id},
-            message="Relacionamento usuário-competição deletado com sucesso",
-            operation="delete_user_competition"
-        )
-        
-        logger.log_api_response(f"/route/user-competitions/{user_id}/{competition_id}", 200, response_data, 
-                               response_time=response_time,
-                               user_id=user_id,
-                               competition_id=competition_id)
-        
-        return response_data
-        
-    except HTTPException as e:
-        response_time = time.time() - start_time
-        logger.error("Erro ao deletar relacionamento usuário-competição", 
-                    error=str(e.detail), 
-                    status_code=e.status_code,
-                    user_id=user_id,
-                    competition_id=competition_id,
-                    response_time=response_time)
-        raise e
-    except Exception as e:
-        response_time = time.time() - start_time
-        logger.error("Erro interno ao deletar relacionamento usuário-competição", 
-                    error=str(e), 
-                    user_id=user_id,
-                    competition_id=competition_id,
-                    response_time=response_time)
-        raise HTTPException(status_code=500, detail=f"Erro interno: {str(e)}")
+    success = await async_db.delete_user_competition(db, user_id, competition_id)
+    if not success:
+        logger.warning("Tentativa de deletar relacionamento inexistente", 
+                      user_id=user_id,
+                      competition_id=competition_id)
+        raise HTTPException(404, detail="Relacionamento não encontrado")
+    
+    response_time = time.time() - start_time
+    response_data = create_success_response(
+        data={"user_id": user_id, "competition_id": competition_id},
+        message="Relacionamento usuário-competição deletado com sucesso",
+        operation="delete_user_competition"
+    )
+    
+    logger.log_api_response(f"/route/user-competitions/{user_id}/{competition_id}", 200, response_data, 
+                           response_time=response_time,
+                           user_id=user_id,
+                           competition_id=competition_id)
+    
+    return response_data
 
 @router.post("/user-teams", response_model=UserTeamCreateDTO, status_code=201)
-async def create_user_team_endpoint(payload: UserTeamCreateDTO, db: Session = Depends(get_db)):
+async def create_user_team_endpoint(payload: UserTeamCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um relacionamento usuário-time
     """
-    try:
-        user = get_user_by_id(db, payload.user_id)
-        if not user:
-            raise HTTPException(400, detail="Usuário não encontrado")
-        
-        team = get_team_by_id(db, payload.team_id)
-        if not team:
-            raise HTTPException(400, detail="Time não encontrado")
-        
-        user_team = create_user_team(db, payload)
-        if not user_team:
-            raise HTTPException(400, detail="Relacionamento já existe")
-        
-        return user_team
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    user_exists, team_exists = await async_db.check_parents_exist(db, (User, payload.user_id), (Team, payload.team_id))
+    if not user_exists:
+        raise HTTPException(400, detail="Usuário não encontrado")
+    
+    if not team_exists:
+        raise HTTPException(400, detail="Time não encontrado")
+    
+    user_team = await async_db.create_user_team(db, payload)
+    if not user_team:
+        raise HTTPException(400, detail="Relacionamento já existe")
+    
+    return user_team
+
+@router.post("/user-teams/bulk", status_code=201)
+async def create_user_teams_bulk_endpoint(payload: conlist(UserTeamCreateDTO, max_length=BULK_MAX_ITEMS), db: AsyncSession = Depends(get_async_db)):
+    """
+    Cria vários relacionamentos usuário-time em lote (até BULK_MAX_ITEMS por requisição)
+    Relacionamentos já existentes são ignorados; IDs inexistentes rejeitam o lote (400)
+    Output: quantidade inserida e total recebido
+    """
+    return await bulk_response(async_db.create_user_teams_bulk, db, payload)
 
 @router.delete("/user-teams/{user_id}/{team_id}")
-async def delete_user_team_endpoint(user_id: str, team_id: str, db: Session = Depends(get_db)):
+async def delete_user_team_endpoint(user_id: str, team_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um relacionamento usuário-time
     """
-    try:
-        success = delete_user_team(db, user_id, team_id)
-        if not success:
-            raise HTTPException(404, detail="Relacionamento não encontrado")
-        
-        return {"message": "Relacionamento usuário-time deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_user_team(db, user_id, team_id)
+    if not success:
+        raise HTTPException(404, detail="Relacionamento não encontrado")
+    
+    return {"message": "Relacionamento usuário-time deletado com sucesso"}
 
 @router.post("/team-competitions", response_model=TeamCompetitionCreateDTO, status_code=201)
-async def create_team_competition_endpoint(payload: TeamCompetitionCreateDTO, db: Session = Depends(get_db)):
+async def create_team_competition_endpoint(payload: TeamCompetitionCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um relacionamento time-competição
     """
-    try:
-        team = get_team_by_id(db, payload.team_id)
-        if not team:
-            raise HTTPException(400, detail="Time não encontrado")
-        
-        competition = get_competition_by_id(db, payload.competition_id)
-        if not competition:
-            raise HTTPException(400, detail="Competição não encontrada")
-        
-        team_competition = create_team_competition(db, payload)
-        if not team_competition:
-            raise HTTPException(400, detail="Relacionamento já existe")
-        
-        return team_competition
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    team_exists, competition_exists = await async_db.check_parents_exist(db, (Team, payload.team_id), (Competition, payload.competition_id))
+    if not team_exists:
+        raise HTTPException(400, detail="Time não encontrado")
+    
+    if not competition_exists:
+        raise HTTPException(400, detail="Competição não encontrada")
+    
+    team_competition = await async_db.create_team_competition(db, payload)
+    if not team_competition:
+        raise HTTPException(400, detail="Relacionamento já existe")
+    
+    return team_competition
+
+@router.post("/team-competitions/bulk", status_code=201)
+async def create_team_competitions_bulk_endpoint(payload: conlist(TeamCompetitionCreateDTO, max_length=BULK_MAX_ITEMS), db: AsyncSession = Depends(get_async_db)):
+    """
+    Cria vários relacionamentos time-competição em lote (até BULK_MAX_ITEMS por requisição)
+    Relacionamentos já existentes são ignorados; IDs inexistentes rejeitam o lote (400)
+    Output: quantidade inserida e total recebido
+    """
+    return await bulk_response(async_db.create_team_competitions_bulk, db, payload)
 
 @router.delete("/team-competitions/{team_id}/{competition_id}")
-async def delete_team_competition_endpoint(team_id: str, competition_id: str, db: Session = Depends(get_db)):
+async def delete_team_competition_endpoint(team_id: str, competition_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um relacionamento time-competição
     """
-    try:
-        success = delete_team_competition(db, team_id, competition_id)
-        if not success:
-            raise HTTPException(404, detail="Relacionamento não encontrado")
-        
-        return {"message": "Relacionamento time-competição deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_team_competition(db, team_id, competition_id)
+    if not success:
+        raise HTTPException(404, detail="Relacionamento não encontrado")
+    
+    return {"message": "Relacionamento time-competição deletado com sucesso"}
 
 @router.post("/exercise-tags", response_model=ExerciseTagCreateDTO, status_code=201)
-async def create_exercise_tag_endpoint(payload: ExerciseTagCreateDTO, db: Session = Depends(get_db)):
+async def create_exercise_tag_endpoint(payload: ExerciseTagCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um relacionamento exercício-tag
     """
-    try:
-        exercise = get_exercise_by_id(db, payload.exercise_id)
-        if not exercise:
-            raise HTTPException(400, detail="Exercício não encontrado")
-        
-        tag = get_tag_by_id(db, payload.tag_id)
-        if not tag:
-            raise HTTPException(400, detail="Tag não encontrada")
-        
-        exercise_tag = create_exercise_tag(db, payload)
-        if not exercise_tag:
-            raise HTTPException(400, detail="Relacionamento já existe")
-        
-        return exercise_tag
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    exercise_exists, tag_exists = await async_db.check_parents_exist(db, (Exercise, payload.exercise_id), (Tag, payload.tag_id))
+    if not exercise_exists:
+        raise HTTPException(400, detail="Exercício não encontrado")
+    
+    if not tag_exists:
+        raise HTTPException(400, detail="Tag não encontrada")
+    
+    exercise_tag = await async_db.create_exercise_tag(db, payload)
+    if not exercise_tag:
+        raise HTTPException(400, detail="Relacionamento já existe")
+    
+    return exercise_tag
+
+@router.post("/exercise-tags/bulk", status_code=201)
+async def create_exercise_tags_bulk_endpoint(payload: conlist(ExerciseTagCreateDTO, max_length=BULK_MAX_ITEMS), db: AsyncSession = Depends(get_async_db)):
+    """
+    Cria vários relacionamentos exercício-tag em lote (até BULK_MAX_ITEMS por requisição)
+    Relacionamentos já existentes são ignorados; IDs inexistentes rejeitam o lote (400)
+    Output: quantidade inserida e total recebido
+    """
+    return await bulk_response(async_db.create_exercise_tags_bulk, db, payload)
 
 @router.delete("/exercise-tags/{exercise_id}/{tag_id}")
-async def delete_exercise_tag_endpoint(exercise_id: str, tag_id: str, db: Session = Depends(get_db)):
+async def delete_exercise_tag_endpoint(exercise_id: str, tag_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um relacionamento exercício-tag
     """
-    try:
-        success = delete_exercise_tag(db, exercise_id, tag_id)
-        if not success:
-            raise HTTPException(404, detail="Relacionamento não encontrado")
-        
-        return {"message": "Relacionamento exercício-tag deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_exercise_tag(db, exercise_id, tag_id)
+    if not success:
+        raise HTTPException(404, detail="Relacionamento não encontrado")
+    
+    return {"message": "Relacionamento exercício-tag deletado com sucesso"}
 
 @router.post("/exercise-competitions", response_model=ExerciseCompetitionCreateDTO, status_code=201)
-async def create_exercise_competition_endpoint(payload: ExerciseCompetitionCreateDTO, db: Session = Depends(get_db)):
+async def create_exercise_competition_endpoint(payload: ExerciseCompetitionCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um relacionamento exercício-competição
     """
-    try:
-        exercise = get_exercise_by_id(db, payload.exercise_id)
-        if not exercise:
-            raise HTTPException(400, detail="Exercício não encontrado")
-        
-        competition = get_competition_by_id(db, payload.competition_id)
-        if not competition:
-            raise HTTPException(400, detail="Competição não encontrada")
-        
-        exercise_competition = create_exercise_competition(db, payload)
-        if not exercise_competition:
-            raise HTTPException(400, detail="Relacionamento já existe")
-        
-        return exercise_competition
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    exercise_exists, competition_exists = await async_db.check_parents_exist(db, (Exercise, payload.exercise_id), (Competition, payload.competition_id))
+    if not exercise_exists:
+        raise HTTPException(400, detail="Exercício não encontrado")
+    
+    if not competition_exists:
+        raise HTTPException(400, detail="Competição não encontrada")
+    
+    exercise_competition = await async_db.create_exercise_competition(db, payload)
+    if not exercise_competition:
+        raise HTTPException(400, detail="Relacionamento já existe")
+    
+    return exercise_competition
+
+@router.post("/exercise-competitions/bulk", status_code=201)
+async def create_exercise_competitions_bulk_endpoint(payload: conlist(ExerciseCompetitionCreateDTO, max_length=BULK_MAX_ITEMS), db: AsyncSession = Depends(get_async_db)):
+    """
+    Cria vários relacionamentos exercício-competição em lote (até BULK_MAX_ITEMS por requisição)
+    Relacionamentos já existentes são ignorados; IDs inexistentes rejeitam o lote (400)
+    Output: quantidade inserida e total recebido
+    """
+    return await bulk_response(async_db.create_exercise_competitions_bulk, db, payload)
 
 @router.delete("/exercise-competitions/{exercise_id}/{competition_id}")
-async def delete_exercise_competition_endpoint(exercise_id: str, competition_id: str, db: Session = Depends(get_db)):
+async def delete_exercise_competition_endpoint(exercise_id: str, competition_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um relacionamento exercício-competição
     """
-    try:
-        success = delete_exercise_competition(db, exercise_id, competition_id)
-        if not success:
-            raise HTTPException(404, detail="Relacionamento não encontrado")
-        
-        return {"message": "Relacionamento exercício-competição deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await async_db.delete_exercise_competition(db, exercise_id, competition_id)
+    if not success:
+        raise HTTPException(404, detail="Relacionamento não encontrado")
+    
+    return {"message": "Relacionamento exercício-competição deletado com sucesso"}
 
 @router.post("/container-competitions", response_model=ContainerCompetitionCreateDTO, status_code=201)
-async def create_container_competition_endpoint(payload: ContainerCompetitionCreateDTO, db: Session = Depends(get_db)):
+async def create_container_competition_endpoint(payload: ContainerCompetitionCreateDTO, db: AsyncSession = Depends(get_async_db)):
     """
     Cria um relacionamento container-competição
     """
-    try:
-        container = get_container_by_id(db, payload.container_id)
-        if not container:
-            raise HTTPException(400, detail="Container não encontrado")
-        
-        competition = get_competition_by_id(db, payload.competition_id)
-        if not competition:
-            raise HTTPException(400, detail="Competição não encontrada")
-        
-        container_competition = create_container_competition(db, payload)
-        if not container_competition:
-            raise HTTPException(400, detail="Relacionamento já existe")
-        
-        return container_competition
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    container_exists, competition_exists = await async_db.check_parents_exist(db, (Container, payload.container_id), (Competition, payload.competition_id))
+    if not container_exists:
+        raise HTTPException(400, detail="Container não encontrado")
+    
+    if not competition_exists:
+        raise HTTPException(400, detail="Competição não encontrada")
+    
+    container_competition = await async_db.create_container_competition(db, payload)
+    if not container_competition:
+        raise HTTPException(400, detail="Relacionamento já existe")
+    
+    return container_competition
+
+@router.post("/container-competitions/bulk", status_code=201)
+async def create_container_competitions_bulk_endpoint(payload: conlist(ContainerCompetitionCreateDTO, max_length=BULK_MAX_ITEMS), db: AsyncSession = Depends(get_async_db)):
+    """
+    Cria vários relacionamentos container-competição em lote (até BULK_MAX_ITEMS por requisição)
+    Relacionamentos já existentes são ignorados; IDs inexistentes rejeitam o lote (400)
+    Output: quantidade inserida e total recebido
+    """
+    return await bulk_response(async_db.create_container_competitions_bulk, db, payload)
 
 @router.delete("/container-competitions/{container_id}/{competition_id}")
-async def delete_container_competition_endpoint(container_id: str, competition_id: str, db: Session = Depends(get_db)):
+async def delete_container_competition_endpoint(container_id: str, competition_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Deleta um relacionamento container-competição
     """
-    try:
-        success = delete_container_competition(db, container_id, competition_id)
-        if not success:
-            raise HTTPException(404, detail="Relacionamento não encontrado")
-        
-        return {"message": "Relacionamento container-competição deletado com sucesso"}
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    success = await async_db.delete_container_competition(db, container_id, competition_id)
+    if not success:
+        raise HTTPException(404, detail="Relacionamento não encontrado")
+    
+    return {"message": "Relacionamento container-competição deletado com sucesso"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 # schemas.py
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, EmailStr
 from datetime import datetime
 
 #########################################################################
@@ -26,6 +26,8 @@ class UserCreateDTO(BaseModel):
     phone_number: Optional[str] = None
 
 class UserReadDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     username: str
     email: EmailStr
@@ -40,12 +42,14 @@ class CompetitionCreateDTO(BaseModel):
     end_date: str
 
 class CompetitionReadDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     name: str
     organizer: str
     invite_code: str
-    start_date: str
-    end_date: str
+    start_date: datetime
+    end_date: datetime
 
 # Exercise DTOs
 class ExerciseCreateDTO(BaseModel):
@@ -56,6 +60,8 @@ class ExerciseCreateDTO(BaseModel):
     port: int
 
 class ExerciseReadDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     link: str
     name: str
@@ -68,6 +74,8 @@ class TagCreateDTO(BaseModel):
     type: str
 
 class TagReadDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     type: str
 
@@ -79,19 +87,31 @@ class TeamCreateDTO(BaseModel):
     score: Optional[int] = 0
 
 class TeamReadDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     name: str
     competition: str
     creator: str
     score: int
 
+# Aggregated DTOs (carregados com eager loading)
+class TeamReadFullDTO(TeamReadDTO):
+    competitions: List[CompetitionReadDTO] = []
+
+class UserReadFullDTO(UserReadDTO):
+    teams: List[TeamReadFullDTO] = []
+    competitions: List[CompetitionReadDTO] = []
+
 # Container DTOs
 class ContainerCreateDTO(BaseModel):
     deadline: str
 
 class ContainerReadDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
-    deadline: str
+    deadline: datetime
 
 # Relationship DTOs
 class UserCompetitionCreateDTO(BaseModel):
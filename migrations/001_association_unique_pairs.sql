@@ -0,0 +1,43 @@
+-- 001_association_unique_pairs.sql
+-- Chave única (a, b) em cada tabela de associação (models.py). Sem ela, bancos existentes aceitam
+-- o mesmo par duas vezes e a criação de relacionamentos (que depende da chave para ignorar
+-- duplicatas) grava repetições
+-- Antes de criar cada chave, remove os pares repetidos que já existam, mantendo uma linha por par
+-- Idempotente (IF NOT EXISTS, MariaDB 10.1.4+)
+-- Aplicar: mariadb -u <usuário> -p <banco> < migrations/001_association_unique_pairs.sql
+
+DELETE duplicate FROM user_competitions duplicate
+    JOIN user_competitions kept
+      ON kept.user_id = duplicate.user_id AND kept.competition_id = duplicate.competition_id
+     AND kept.id < duplicate.id;
+ALTER TABLE user_competitions ADD UNIQUE INDEX IF NOT EXISTS uq_user_competition (user_id, competition_id);
+
+DELETE duplicate FROM user_teams duplicate
+    JOIN user_teams kept
+      ON kept.user_id = duplicate.user_id AND kept.team_id = duplicate.team_id
+     AND kept.id < duplicate.id;
+ALTER TABLE user_teams ADD UNIQUE INDEX IF NOT EXISTS uq_user_team (user_id, team_id);
+
+DELETE duplicate FROM team_competitions duplicate
+    JOIN team_competitions kept
+      ON kept.team_id = duplicate.team_id AND kept.competition_id = duplicate.competition_id
+     AND kept.id < duplicate.id;
+ALTER TABLE team_competitions ADD UNIQUE INDEX IF NOT EXISTS uq_team_competition (team_id, competition_id);
+
+DELETE duplicate FROM exercise_tags duplicate
+    JOIN exercise_tags kept
+      ON kept.exercise_id = duplicate.exercise_id AND kept.tag_id = duplicate.tag_id
+     AND kept.id < duplicate.id;
+ALTER TABLE exercise_tags ADD UNIQUE INDEX IF NOT EXISTS uq_exercise_tag (exercise_id, tag_id);
+
+DELETE duplicate FROM exercise_competitions duplicate
+    JOIN exercise_competitions kept
+      ON kept.exercise_id = duplicate.exercise_id AND kept.competition_id = duplicate.competition_id
+     AND kept.id < duplicate.id;
+ALTER TABLE exercise_competitions ADD UNIQUE INDEX IF NOT EXISTS uq_exercise_competition (exercise_id, competition_id);
+
+DELETE duplicate FROM container_competitions duplicate
+    JOIN container_competitions kept
+      ON kept.container_id = duplicate.container_id AND kept.competition_id = duplicate.competition_id
+     AND kept.id < duplicate.id;
+ALTER TABLE container_competitions ADD UNIQUE INDEX IF NOT EXISTS uq_container_competition (container_id, competition_id);
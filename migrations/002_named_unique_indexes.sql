@@ -0,0 +1,20 @@
+-- 002_named_unique_indexes.sql
+-- Bancos criados antes dos índices únicos nomeados (models.py): o unique=True antigo gerou chaves
+-- únicas com o nome da coluna (username, email, invite_code, type). Troca cada uma pelo índice
+-- nomeado equivalente em um único ALTER por tabela, sem janela sem unicidade
+-- Idempotente (IF EXISTS / IF NOT EXISTS, MariaDB 10.1.4+); bancos novos (create_all) não mudam
+-- Aplicar: mariadb -u <usuário> -p <banco> < migrations/002_named_unique_indexes.sql
+
+ALTER TABLE users
+    DROP INDEX IF EXISTS email,
+    DROP INDEX IF EXISTS username,
+    ADD UNIQUE INDEX IF NOT EXISTS ix_users_email (email),
+    ADD UNIQUE INDEX IF NOT EXISTS ix_users_username (username);
+
+ALTER TABLE competitions
+    DROP INDEX IF EXISTS invite_code,
+    ADD UNIQUE INDEX IF NOT EXISTS ix_competitions_invite_code (invite_code);
+
+ALTER TABLE tags
+    DROP INDEX IF EXISTS `type`,
+    ADD UNIQUE INDEX IF NOT EXISTS ix_tags_type (`type`);
@@ -0,0 +1,13 @@
+-- 003_association_second_column_indexes.sql
+-- Índice próprio na segunda coluna de cada tabela de associação (models.py); a primeira coluna
+-- já é servida pelo prefixo da chave única (a, b) de 001_association_unique_pairs.sql
+-- O InnoDB descarta sozinho o índice implícito da FK quando outro índice passa a atendê-la
+-- Idempotente (IF NOT EXISTS, MariaDB 10.1.4+)
+-- Aplicar: mariadb -u <usuário> -p <banco> < migrations/003_association_second_column_indexes.sql
+
+ALTER TABLE user_competitions ADD INDEX IF NOT EXISTS ix_user_competitions_competition_id (competition_id);
+ALTER TABLE user_teams ADD INDEX IF NOT EXISTS ix_user_teams_team_id (team_id);
+ALTER TABLE team_competitions ADD INDEX IF NOT EXISTS ix_team_competitions_competition_id (competition_id);
+ALTER TABLE exercise_tags ADD INDEX IF NOT EXISTS ix_exercise_tags_tag_id (tag_id);
+ALTER TABLE exercise_competitions ADD INDEX IF NOT EXISTS ix_exercise_competitions_competition_id (competition_id);
+ALTER TABLE container_competitions ADD INDEX IF NOT EXISTS ix_container_competitions_competition_id (competition_id);
@@ -0,0 +1,17 @@
+-- 004_password_ascii_bin.sql
+-- users.password como VARCHAR(128) ASCII com collation binária (models.py), no lugar do
+-- VARCHAR(256) utf8mb4 criado pela versão anterior
+-- Os valores guardados cabem e não mudam: hashes SHA-256 legados são 64 caracteres hex e hashes
+-- Argon2id (~97 caracteres) usam só ASCII; verify_password compara o SHA-256 legado pelos bytes
+-- (bytes.fromhex) e o Argon2id pelo próprio argon2-cffi, então a collation não interfere
+-- Com STRICT_ALL_TABLES o ALTER falha (sem alterar nada) se alguma senha não couber ou não for ASCII;
+-- a consulta abaixo lista esses usuários antes
+-- Aplicar: mariadb -u <usuário> -p <banco> < migrations/004_password_ascii_bin.sql
+
+SELECT id, CHAR_LENGTH(password) AS password_length
+  FROM users
+ WHERE CHAR_LENGTH(password) > 128 OR password <> CONVERT(password USING ascii);
+
+SET SESSION sql_mode = CONCAT(@@SESSION.sql_mode, ',STRICT_ALL_TABLES');
+
+ALTER TABLE users MODIFY password VARCHAR(128) CHARACTER SET ascii COLLATE ascii_bin NOT NULL;
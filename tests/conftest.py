@@ -0,0 +1,123 @@
+# conftest.py
+#Os testes rodam contra SQLite (aiosqlite nas rotas), sem MariaDB nem Redis
+#As variáveis de ambiente precisam existir antes do import de database/main
+import os
+import tempfile
+import uuid
+
+_DB_FILE = os.path.join(tempfile.mkdtemp(prefix="lycosidae-tests-"), "test.sqlite")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_FILE}"
+os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_FILE}"
+os.environ["PASS_SALT"] = "test-pepper"
+os.environ["DB_POOL_SIZE"] = "2"
+os.environ.pop("REDIS_URL", None)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    #SQLite só valida chaves estrangeiras com o pragma ligado em cada conexão
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Cliente da API com startup/shutdown reais (criação das tabelas e aquecimento do pool)
+    """
+    import database
+    import main
+
+    event.listen(database.get_async_engine().sync_engine, "connect", _enable_foreign_keys)
+    with TestClient(main.app) as test_client:
+        yield test_client
+        #Fecha as conexões aiosqlite no mesmo event loop em que foram abertas
+        test_client.portal.call(database.get_async_engine().dispose)
+
+def unique(prefix: str) -> str:
+    """
+    Valor único por teste (o banco é compartilhado pela sessão de testes)
+    """
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+@pytest.fixture
+def make_exercise(client):
+    def make():
+        response = client.post("/route/exercises", json={
+            "link": "https://example.com", "name": unique("exercise"),
+            "score": 100, "difficulty": "easy", "port": 8080,
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+    return make
+
+@pytest.fixture
+def make_tag(client):
+    def make():
+        response = client.post("/route/tags", json={"type": unique("tag")})
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+    return make
+
+@pytest.fixture
+def db_session(client):
+    """
+    Session síncrona em uma transação própria (commit no fim), sobre as tabelas criadas no startup
+    """
+    from database import get_session_factory
+
+    with get_session_factory().begin() as session:
+        yield session
+
+class FakeRedis:
+    """
+    Redis em memória com a parte da API usada por cache.py (get, setex, delete)
+    on_delete: chamado uma vez após o próximo delete (simula uma escrita concorrente no cache)
+    """
+
+    def __init__(self, store: dict):
+        self.store = store
+        self.on_delete = None
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode('utf-8') if isinstance(value, str) else value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+        callback, self.on_delete = self.on_delete, None
+        if callback:
+            callback()
+
+class FakeAsyncRedis:
+    """
+    Versão assíncrona do FakeRedis, sobre o mesmo dicionário
+    """
+
+    def __init__(self, sync_client: FakeRedis):
+        self.sync_client = sync_client
+
+    async def get(self, key):
+        return self.sync_client.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.sync_client.setex(key, ttl, value)
+
+    async def delete(self, *keys):
+        self.sync_client.delete(*keys)
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    Liga o cache do Redis (sync e async) em um FakeRedis compartilhado
+    """
+    import cache
+
+    client = FakeRedis({})
+    async_client = FakeAsyncRedis(client)
+    monkeypatch.setattr(cache, "get_redis", lambda: client)
+    monkeypatch.setattr(cache, "get_async_redis", lambda: async_client)
+    return client
@@ -0,0 +1,46 @@
+# test_bulk_endpoints.py
+from dbutils_mysql import BULK_MAX_ITEMS
+
+def test_bulk_inserts_new_relationships(client, make_exercise, make_tag):
+    exercise_id = make_exercise()
+    payload = [{"exercise_id": exercise_id, "tag_id": make_tag()} for _ in range(3)]
+
+    response = client.post("/route/exercise-tags/bulk", json=payload)
+
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 3, "total": 3}
+
+def test_bulk_ignores_existing_and_repeated_relationships(client, make_exercise, make_tag):
+    exercise_id = make_exercise()
+    existing = {"exercise_id": exercise_id, "tag_id": make_tag()}
+    assert client.post("/route/exercise-tags", json=existing).status_code == 201
+    new = {"exercise_id": exercise_id, "tag_id": make_tag()}
+
+    response = client.post("/route/exercise-tags/bulk", json=[existing, new, new])
+
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 1, "total": 3}
+
+def test_bulk_with_unknown_ids_rejects_the_whole_batch(client, make_exercise, make_tag):
+    exercise_id = make_exercise()
+    valid = {"exercise_id": exercise_id, "tag_id": make_tag()}
+    unknown = {"exercise_id": exercise_id, "tag_id": "does-not-exist"}
+
+    response = client.post("/route/exercise-tags/bulk", json=[valid, unknown])
+
+    assert response.status_code == 400
+    #A transação foi desfeita: o relacionamento válido não ficou gravado
+    assert client.post("/route/exercise-tags/bulk", json=[valid]).json() == {"inserted": 1, "total": 1}
+
+def test_bulk_rejects_payload_above_the_limit(client):
+    item = {"exercise_id": "e", "tag_id": "t"}
+
+    response = client.post("/route/exercise-tags/bulk", json=[item] * (BULK_MAX_ITEMS + 1))
+
+    assert response.status_code == 422
+
+def test_bulk_with_empty_payload_inserts_nothing(client):
+    response = client.post("/route/exercise-tags/bulk", json=[])
+
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 0, "total": 0}
@@ -0,0 +1,79 @@
+# test_cache_invalidation.py
+from conftest import unique
+from database import get_session_factory
+from dbutils_mysql import invite_code_cache, update_exercise
+from schemas import ExerciseCreateDTO
+
+def exercise_payload(name: str) -> dict:
+    return {"link": "https://example.com", "name": name, "score": 100, "difficulty": "easy", "port": 8080}
+
+def test_get_by_id_reads_through_the_cache(client, fake_redis, make_exercise):
+    exercise_id = make_exercise()
+
+    first = client.get(f"/route/exercises/{exercise_id}")
+
+    assert first.status_code == 200
+    assert fake_redis.store[f"exercises:{exercise_id}"] == first.content
+    assert client.get(f"/route/exercises/{exercise_id}").json() == first.json()
+
+def test_update_invalidates_again_after_the_commit(client, fake_redis, make_exercise):
+    exercise_id = make_exercise()
+    key = f"exercises:{exercise_id}"
+    assert client.get(f"/route/exercises/{exercise_id}").status_code == 200
+    stale = fake_redis.store[key]
+    #Um GET concorrente recoloca a linha antiga no cache entre o UPDATE e o commit
+    fake_redis.on_delete = lambda: fake_redis.store.__setitem__(key, stale)
+
+    updated = client.put(f"/route/exercises/{exercise_id}", json=exercise_payload("renamed"))
+
+    assert updated.status_code == 200
+    assert key not in fake_redis.store
+    assert client.get(f"/route/exercises/{exercise_id}").json()["name"] == "renamed"
+
+def test_delete_invalidates_the_cached_row(client, fake_redis, make_exercise):
+    exercise_id = make_exercise()
+    assert client.get(f"/route/exercises/{exercise_id}").status_code == 200
+
+    assert client.delete(f"/route/exercises/{exercise_id}").status_code == 200
+
+    assert f"exercises:{exercise_id}" not in fake_redis.store
+    assert client.get(f"/route/exercises/{exercise_id}").status_code == 404
+
+def test_competition_update_invalidates_invite_code_caches(client, fake_redis):
+    invite_code = unique("ic")[:20]
+    competition = {"name": "before", "organizer": "org", "invite_code": invite_code,
+                   "start_date": "2025-01-01T00:00:00", "end_date": "2025-02-01T00:00:00"}
+    competition_id = client.post("/route/competitions", json=competition).json()["id"]
+    assert client.get(f"/route/competitions/invite/{invite_code}").json()["name"] == "before"
+    assert f"ic:{invite_code}" in fake_redis.store
+    assert invite_code_cache.get(invite_code) is not None
+
+    response = client.put(f"/route/competitions/{competition_id}", json={**competition, "name": "after"})
+
+    assert response.status_code == 200
+    assert f"ic:{invite_code}" not in fake_redis.store
+    assert f"ic_id:{competition_id}" not in fake_redis.store
+    assert invite_code_cache.get(invite_code) is None
+    assert client.get(f"/route/competitions/invite/{invite_code}").json()["name"] == "after"
+
+def test_competition_update_returns_the_stored_dates(client):
+    competition = {"name": "dates", "organizer": "org", "invite_code": unique("ic")[:20],
+                   "start_date": "2025-01-01T00:00:00Z", "end_date": "2025-02-01T00:00:00Z"}
+    competition_id = client.post("/route/competitions", json=competition).json()["id"]
+
+    updated = client.put(f"/route/competitions/{competition_id}", json=competition).json()
+
+    assert updated == client.get(f"/route/competitions/{competition_id}").json()
+
+def test_sync_crud_update_invalidates_the_cached_row(client, fake_redis, make_exercise):
+    exercise_id = make_exercise()
+    key = f"exercises:{exercise_id}"
+    fake_redis.store[key] = b"stale"
+
+    with get_session_factory().begin() as db:
+        update_exercise(db, exercise_id, ExerciseCreateDTO(**exercise_payload("sync")))
+        assert key not in fake_redis.store
+        #Recolocada antes do commit: o listener after_commit remove de novo
+        fake_redis.store[key] = b"stale"
+
+    assert key not in fake_redis.store
@@ -0,0 +1,41 @@
+# test_exception_handlers.py
+import dbutils_mysql_async as async_db
+import main
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+@pytest.fixture
+def raw_client(client):
+    """
+    Cliente que devolve a resposta 500 em vez de relançar a exceção no teste
+    """
+    return TestClient(main.app, raise_server_exceptions=False)
+
+def test_database_errors_become_a_generic_500(raw_client, monkeypatch):
+    async def failing(db, exercise_id):
+        raise OperationalError("SELECT ...", {}, Exception("connection lost: secret-host"))
+    monkeypatch.setattr(async_db, "get_exercise_by_id", failing)
+
+    response = raw_client.get("/route/exercises/any")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Erro interno no banco de dados"}
+    assert "secret-host" not in response.text
+
+def test_unexpected_errors_become_a_generic_500(raw_client, monkeypatch):
+    async def failing(db, exercise_id):
+        raise RuntimeError("secret detail")
+    monkeypatch.setattr(async_db, "get_exercise_by_id", failing)
+
+    response = raw_client.get("/route/exercises/any")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Erro interno do servidor"}
+    assert "secret detail" not in response.text
+
+def test_domain_errors_keep_their_status(client):
+    response = client.get("/route/exercises/does-not-exist")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Exercício não encontrado"}
@@ -0,0 +1,55 @@
+# test_logger.py
+import io
+import logging
+import sys
+
+import pytest
+
+from logger import BracketLevelFormatter
+
+ANSI = "\033["
+
+class _Tty(io.StringIO):
+    def isatty(self):
+        return True
+
+@pytest.fixture
+def colored_formatter(monkeypatch):
+    #As cores só são ligadas quando o stderr é um terminal e NO_COLOR não está definido
+    monkeypatch.setattr(sys, "stderr", _Tty())
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    formatter = BracketLevelFormatter(fmt="%(levelname_br)s %(message)s", use_color=True)
+    assert formatter.use_color
+    return formatter
+
+def _record(msg, ctx=None):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+    if ctx is not None:
+        record.ctx = ctx
+    return record
+
+def test_colorizes_a_json_only_message_without_touching_the_record(colored_formatter):
+    record = _record('{"a": 1}')
+
+    output = colored_formatter.format(record)
+
+    json_part = output.split(" ", 1)[1]
+    assert ANSI in json_part
+    assert BracketLevelFormatter.JSON_COLORS["key"] + '"a"' in json_part
+    assert record.msg == '{"a": 1}'
+
+def test_colorizes_compact_and_nested_context(colored_formatter):
+    compact = colored_formatter.format(_record("login", {"user": "ana"}))
+    nested = colored_formatter.format(_record("batch", {"per_table": {"SELECT users": {"ops": 2}}}))
+
+    assert BracketLevelFormatter.JSON_COLORS["string"] + '"ana"' in compact
+    json_part = nested.split("\n", 1)[1]
+    assert BracketLevelFormatter.JSON_COLORS["number"] + "2" in json_part
+
+def test_plain_formatter_keeps_json_without_ansi():
+    formatter = BracketLevelFormatter(fmt="%(levelname_br)s %(message)s", use_color=False)
+
+    output = formatter.format(_record('{"a": 1}', {"per_table": {"x": 1}}))
+
+    assert ANSI not in output
+    assert output.endswith('{\n  "per_table": {\n    "x": 1\n  }\n}')
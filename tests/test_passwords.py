@@ -0,0 +1,74 @@
+# test_passwords.py
+import hashlib
+from collections import OrderedDict
+from conftest import unique
+import dbutils_mysql
+from dbutils_mysql import PASS_SALT, authenticate_user, pass_hasher, verify_password
+from models import User
+
+def baseline_hash(password: str) -> str:
+    """
+    Formato gravado pela versão anterior: SHA-256 em hex de senha + PASS_SALT
+    """
+    return hashlib.sha256((password + PASS_SALT).encode('utf-8')).hexdigest()
+
+def test_argon2_hash_verifies_and_rejects_wrong_password():
+    stored = pass_hasher("s3cret")
+
+    assert stored.startswith("$argon2id$")
+    assert verify_password(stored, "s3cret") == (True, False)
+    assert verify_password(stored, "wrong") == (False, False)
+
+def test_legacy_hash_verifies_and_asks_for_rehash():
+    stored = baseline_hash("s3cret")
+
+    assert verify_password(stored, "s3cret") == (True, True)
+    assert verify_password(stored, "wrong") == (False, False)
+
+def test_legacy_hash_comparison_does_not_depend_on_case():
+    #A comparação é feita sobre os bytes do digest, não sobre o texto guardado na coluna
+    assert verify_password(baseline_hash("s3cret").upper(), "s3cret") == (True, True)
+
+def test_malformed_hash_is_rejected():
+    assert verify_password("not-a-hash", "s3cret") == (False, False)
+
+def test_stored_hashes_fit_the_ascii_password_column():
+    column_length = User.__table__.c.password.type.length
+    for stored in (baseline_hash("s3cret"), pass_hasher("s3cret")):
+        assert len(stored) <= column_length
+        assert stored.isascii()
+
+def test_authenticate_rehashes_legacy_password(db_session):
+    user = User(username=unique("legacy"), email=f"{unique('legacy')}@example.com",
+                password=baseline_hash("s3cret"))
+    db_session.add(user)
+    db_session.flush()
+
+    authenticated = authenticate_user(db_session, user.email, "s3cret")
+
+    assert authenticated is not None and authenticated.id == user.id
+    db_session.refresh(user)
+    assert user.password.startswith("$argon2id$")
+    assert authenticate_user(db_session, user.email, "s3cret") is not None
+    assert authenticate_user(db_session, user.email, "wrong") is None
+
+def test_verify_cache_hits_until_the_ttl_expires(monkeypatch):
+    calls = []
+    clock = [1000.0]
+    def fake_verify(stored, candidate):
+        calls.append(candidate)
+        return True, False
+
+    monkeypatch.setattr(dbutils_mysql, "PASS_HASH_CACHE", True)
+    monkeypatch.setattr(dbutils_mysql, "_verify_password", fake_verify)
+    monkeypatch.setattr(dbutils_mysql.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(dbutils_mysql, "_verify_cache", OrderedDict())
+
+    assert verify_password("stored", "s3cret") == (True, False)
+    clock[0] += dbutils_mysql.PASS_HASH_CACHE_TTL - 1
+    assert verify_password("stored", "s3cret") == (True, False)
+    assert calls == ["s3cret"]
+
+    clock[0] += 2
+    assert verify_password("stored", "s3cret") == (True, False)
+    assert calls == ["s3cret", "s3cret"]
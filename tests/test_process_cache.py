@@ -0,0 +1,35 @@
+# test_process_cache.py
+from dbutils_mysql import ProcessCache
+
+def test_returns_stored_values_and_none_for_missing_keys():
+    cache = ProcessCache(size=4, ttl=60)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+def test_entries_expire_after_the_ttl():
+    cache = ProcessCache(size=4, ttl=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+
+def test_evicts_the_least_recently_stored_entry():
+    cache = ProcessCache(size=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 3)
+    cache.put("c", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4
+
+def test_clear_drops_every_entry():
+    cache = ProcessCache(size=4, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.clear()
+
+    assert cache.get("a") is None and cache.get("b") is None